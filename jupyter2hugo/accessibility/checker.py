@@ -1,9 +1,12 @@
 """Accessibility checking with pa11y integration."""
 
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import asyncio
 import subprocess
+import tempfile
 import json
+import os
 
 
 class AccessibilityChecker:
@@ -30,36 +33,174 @@ class AccessibilityChecker:
         """
         try:
             result = subprocess.run(
-                ['pa11y', '--reporter', 'json', '--standard', self.standard, url],
+                self._pa11y_command(url),
                 capture_output=True,
                 text=True,
                 check=False
             )
+            return self._parse_result(url, result.stdout, result.stderr)
 
-            if result.stdout:
-                issues = json.loads(result.stdout)
-                return {
-                    'url': url,
-                    'issues': issues,
-                    'count': len(issues),
-                    'passed': len(issues) == 0
-                }
-            else:
+        except FileNotFoundError:
+            raise ImportError("pa11y not found. Install with: npm install -g pa11y")
+        except Exception as e:
+            return {
+                'url': url,
+                'error': str(e),
+                'passed': False
+            }
+
+    async def _check_url_async(self, url: str, sem: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Run pa11y on a URL without blocking the event loop.
+
+        Args:
+            url: URL to check
+            sem: Semaphore bounding the number of running pa11y processes
+
+        Returns:
+            Dict with results
+        """
+        async with sem:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *self._pa11y_command(url),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                out, err = await proc.communicate()
+                return self._parse_result(
+                    url, out.decode('utf-8', 'replace'), err.decode('utf-8', 'replace')
+                )
+
+            except FileNotFoundError:
+                raise ImportError("pa11y not found. Install with: npm install -g pa11y")
+            except Exception as e:
                 return {
                     'url': url,
-                    'error': result.stderr,
+                    'error': str(e),
                     'passed': False
                 }
 
-        except FileNotFoundError:
-            raise ImportError("pa11y not found. Install with: npm install -g pa11y")
-        except Exception as e:
+    async def _check_urls_async(self, urls: List[str], max_concurrency: int) -> List[Dict[str, Any]]:
+        """Check URLs with at most max_concurrency pa11y processes at a time."""
+        # Created inside the running loop (Python < 3.10 binds it on creation)
+        sem = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(*(self._check_url_async(url, sem) for url in urls))
+
+    def check_urls_concurrently(
+        self,
+        urls: List[str],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Run one pa11y process per URL, overlapping the runs.
+
+        Every pa11y run starts its own headless browser and mostly waits on
+        it, so the processes are driven from a single event loop instead of
+        a thread each.
+
+        Args:
+            urls: URLs to check
+            max_concurrency: Maximum number of concurrent pa11y processes
+
+        Returns:
+            List of result dicts, in the same order as urls
+        """
+        return asyncio.run(self._check_urls_async(urls, max_concurrency))
+
+    def _pa11y_command(self, url: str) -> List[str]:
+        """Build the pa11y command line for a URL."""
+        return ['pa11y', '--reporter', 'json', '--standard', self.standard, url]
+
+    def _parse_result(self, url: str, stdout: str, stderr: str) -> Dict[str, Any]:
+        """Convert pa11y JSON output into a result dict."""
+        if stdout:
+            issues = json.loads(stdout)
             return {
                 'url': url,
-                'error': str(e),
+                'issues': issues,
+                'count': len(issues),
+                'passed': len(issues) == 0
+            }
+        else:
+            return {
+                'url': url,
+                'error': stderr,
                 'passed': False
             }
 
+    def check_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run pa11y-ci on a batch of URLs.
+
+        Unlike check_url, a single pa11y-ci process (and browser) is reused
+        for every page, avoiding a browser cold start per URL.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            List of result dicts, in the same order as urls
+        """
+        config = {'urls': urls, 'defaults': {'standard': self.standard}}
+
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump(config, f)
+            config_path = f.name
+
+        try:
+            result = subprocess.run(
+                ['pa11y-ci', '--config', config_path, '--json'],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+        except FileNotFoundError:
+            raise ImportError("pa11y-ci not found. Install with: npm install -g pa11y-ci")
+        finally:
+            os.unlink(config_path)
+
+        try:
+            report = json.loads(result.stdout)
+        except ValueError:
+            error = result.stderr or result.stdout
+            return [{'url': url, 'error': error, 'passed': False} for url in urls]
+
+        report_results = report.get('results') if isinstance(report, dict) else None
+        if not isinstance(report_results, dict):
+            report_results = {}
+
+        results = []
+        for url in urls:
+            # A page missing from the report (e.g. pa11y-ci stopped partway)
+            # was never checked, so it fails rather than passing by default
+            if url not in report_results:
+                results.append({
+                    'url': url,
+                    'error': result.stderr or 'No result reported by pa11y-ci',
+                    'passed': False
+                })
+                continue
+
+            issues = report_results[url]
+
+            # Pages that failed to load are reported as a single error object
+            if len(issues) == 1 and 'code' not in issues[0]:
+                results.append({
+                    'url': url,
+                    'error': issues[0].get('message', ''),
+                    'passed': False
+                })
+            else:
+                results.append({
+                    'url': url,
+                    'issues': issues,
+                    'count': len(issues),
+                    'passed': len(issues) == 0
+                })
+
+        return results
+
     def check_html_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Run pa11y on an HTML file.
@@ -123,23 +264,30 @@ class AccessibilityChecker:
         return "\n".join(report_lines)
 
 
-def run_accessibility_check(hugo_site_dir: Path, build_first: bool = True) -> bool:
+def run_accessibility_check(
+    hugo_site_dir: Path,
+    build_first: bool = True,
+    max_workers: Optional[int] = None
+) -> bool:
     """
     Run accessibility check on a Hugo site.
 
     Args:
         hugo_site_dir: Path to Hugo site directory
         build_first: Whether to build the site first
+        max_workers: Maximum number of concurrent pa11y processes when
+            pa11y-ci is unavailable (defaults to min(8, CPU count))
 
     Returns:
         True if all checks passed
     """
     if build_first:
-        # Build the Hugo site
+        # Build the Hugo site; only stderr is kept, for the failure message
         result = subprocess.run(
-            ['hugo', '--destination', 'public'],
+            ['hugo', '--destination', 'public', '--quiet'],
             cwd=hugo_site_dir,
-            capture_output=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
 
         if result.returncode != 0:
@@ -158,14 +306,21 @@ def run_accessibility_check(hugo_site_dir: Path, build_first: bool = True) -> bo
         print("No HTML files found to check")
         return False
 
-    # Run pa11y on each file
     checker = AccessibilityChecker()
-    results = []
+    urls = [f"file://{html_file.absolute()}" for html_file in html_files]
 
-    for html_file in html_files[:10]:  # Check first 10 files
+    for html_file in html_files:
         print(f"Checking: {html_file.relative_to(public_dir)}")
-        result = checker.check_html_file(html_file)
-        results.append(result)
+
+    try:
+        # Check every page in one pa11y-ci run that shares a single browser
+        results = checker.check_urls(urls)
+    except ImportError:
+        # Fall back to one pa11y process per page, several at a time
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+
+        results = checker.check_urls_concurrently(urls, max_concurrency=max_workers)
 
     # Generate and print report
     report = checker.generate_report(results)
@@ -1,11 +1,10 @@
 """Command-line interface for jupyter2hugo."""
 
 from pathlib import Path
+from typing import Optional
 import click
 import sys
 
-from .core.hugo_builder import HugoBuilder
-
 
 @click.command()
 @click.argument('source_dir', type=click.Path(exists=True, file_okay=False, path_type=Path))
@@ -13,15 +12,33 @@ from .core.hugo_builder import HugoBuilder
 @click.option(
     '--check-accessibility',
     is_flag=True,
-    help='Run accessibility checks after conversion (requires pa11y)'
+    help='Run accessibility checks after conversion (requires pa11y-ci or pa11y)'
 )
 @click.option(
     '--verbose', '-v',
     is_flag=True,
     help='Enable verbose output'
 )
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Number of processes for converting files (default: number of CPUs)'
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Only reconvert pages whose source files changed since the last build'
+)
 @click.version_option(version='0.1.0')
-def main(source_dir: Path, output_dir: Path, check_accessibility: bool, verbose: bool):
+def main(
+    source_dir: Path,
+    output_dir: Path,
+    check_accessibility: bool,
+    verbose: bool,
+    jobs: Optional[int],
+    incremental: bool
+):
     """
     Convert a Jupyter Book project to a Hugo static site.
 
@@ -45,8 +62,14 @@ def main(source_dir: Path, output_dir: Path, check_accessibility: bool, verbose:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
+        # Imported here so --help and --version don't load the converters
+        # (nbconvert, yaml) before click can answer them
+        from .core.hugo_builder import HugoBuilder
+
         # Build the Hugo site
-        builder = HugoBuilder(source_dir, output_dir, verbose=verbose)
+        builder = HugoBuilder(
+            source_dir, output_dir, verbose=verbose, jobs=jobs, incremental=incremental
+        )
         builder.build()
 
         click.echo()
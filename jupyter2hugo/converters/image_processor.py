@@ -1,15 +1,42 @@
 """Process and copy images for Hugo static site."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import threading
 import shutil
+import os
 import re
 
+# External URLs and data URIs are left alone (except site-absolute /images/
+# paths); the regex engine rejects them so they never reach Python callbacks
+_SKIP_IMG = r'(?!https?://|data:|/(?!images/))'
+
+# Markdown images: ![alt](path)
+_MD_IMG = rf'(?P<md_img>!\[(?P<md_img_alt>[^\]]*)\]\({_SKIP_IMG}(?P<md_img_src>[^)]+)\))'
+
+# HTML <img> tags (the src=" matched must be the tag's last one)
+_HTML_IMG = (
+    r'(?P<html_img><img\s+(?P<html_img_prefix>[^>]*src=")(?![^>]*src=")'
+    rf'{_SKIP_IMG}(?P<html_img_src>[^"]+)(?P<html_img_suffix>"[^>]*)>)'
+)
+
+_IMAGE_PATTERN = re.compile(f'{_MD_IMG}|{_HTML_IMG}')
+
+_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp', '.ico'})
+
 
 class ImageProcessor:
     """Handle image copying and path rewriting for Hugo."""
 
-    def __init__(self, source_dir: Path, static_dir: Path, maintain_structure: bool = True):
+    def __init__(
+        self,
+        source_dir: Path,
+        static_dir: Path,
+        maintain_structure: bool = True,
+        use_hardlinks: bool = True
+    ):
         """
         Initialize the image processor.
 
@@ -17,11 +44,17 @@ class ImageProcessor:
             source_dir: Root directory of Jupyter Book source
             static_dir: Hugo static directory for images
             maintain_structure: Whether to maintain directory structure
+            use_hardlinks: Hardlink images into the static directory when
+                possible instead of copying them (disable if images are
+                post-processed in place)
         """
         self.source_dir = source_dir
         self.static_dir = static_dir / "images"
         self.maintain_structure = maintain_structure
+        self.use_hardlinks = use_hardlinks
         self.copied_images = {}  # Map source path -> static path
+        self._lock = threading.Lock()  # Guards copied_images across threads
+        self._resolved_paths = {}  # Map joined reference path -> resolved path
 
     def process_images(self, markdown: str, current_file: Path) -> Tuple[str, List[str]]:
         """
@@ -36,83 +69,65 @@ class ImageProcessor:
         """
         copied = []
 
-        # Pattern for markdown images: ![alt](path)
-        image_pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
+        # Resolve image paths relative to the current file
+        current_dir = current_file.parent if current_file.is_file() else current_file
 
-        def replace_image(match):
-            alt_text = match.group(1)
-            image_path = match.group(2)
+        # Markdown images and HTML <img> tags are rewritten in a single scan
+        replace_image = partial(
+            self._replace_image_match, current_dir=str(current_dir), copied=copied
+        )
+        markdown = _IMAGE_PATTERN.sub(replace_image, markdown)
 
-            # Skip external URLs and data URIs
-            if image_path.startswith(('http://', 'https://', 'data:', '/')):
-                if not image_path.startswith('/images/'):
-                    return match.group(0)
-
-            # Resolve image path relative to current file
-            if current_file.is_file():
-                current_dir = current_file.parent
-            else:
-                current_dir = current_file
-
-            resolved_path = (current_dir / image_path).resolve()
-
-            # Copy image and get new path
-            try:
-                new_path = self._copy_image(resolved_path)
-                copied.append(str(resolved_path))
-
-                # Convert to Hugo static URL
-                # Don't add /images/ prefix if path already starts with images/
-                if new_path.startswith('images/'):
-                    hugo_url = f"/{new_path}"
-                else:
-                    hugo_url = f"/images/{new_path}"
-                return f'![{alt_text}]({hugo_url})'
-            except Exception as e:
-                # Keep original if copy fails
-                print(f"Warning: Failed to copy image {image_path}: {e}")
-                return match.group(0)
-
-        markdown = re.sub(image_pattern, replace_image, markdown)
-
-        # Also handle HTML <img> tags
-        html_img_pattern = r'<img\s+([^>]*src=")([^"]+)("[^>]*)>'
-
-        def replace_html_image(match):
-            prefix = match.group(1)
-            image_path = match.group(2)
-            suffix = match.group(3)
-
-            # Skip external URLs
-            if image_path.startswith(('http://', 'https://', 'data:', '/')):
-                if not image_path.startswith('/images/'):
-                    return match.group(0)
-
-            # Resolve and copy
-            if current_file.is_file():
-                current_dir = current_file.parent
-            else:
-                current_dir = current_file
+        return markdown, copied
 
-            resolved_path = (current_dir / image_path).resolve()
+    def _replace_image_match(self, match: re.Match, current_dir: str, copied: List[str]) -> str:
+        """
+        Rewrite a single image reference matched by _IMAGE_PATTERN.
 
-            try:
-                new_path = self._copy_image(resolved_path)
-                copied.append(str(resolved_path))
+        Args:
+            match: Match of a markdown image or HTML <img> tag
+            current_dir: Directory of the current source file
+            copied: List collecting the source paths of copied images
 
-                # Don't add /images/ prefix if path already starts with images/
-                if new_path.startswith('images/'):
-                    hugo_url = f"/{new_path}"
-                else:
-                    hugo_url = f"/images/{new_path}"
-                return f'<img {prefix}{hugo_url}{suffix}>'
-            except Exception as e:
-                print(f"Warning: Failed to copy image {image_path}: {e}")
-                return match.group(0)
+        Returns:
+            Replacement text for the match
+        """
+        resolved_paths = self._resolved_paths
 
-        markdown = re.sub(html_img_pattern, replace_html_image, markdown)
+        is_markdown = match.lastgroup == 'md_img'
+        if is_markdown:
+            image_path = match.group('md_img_src')
+        else:
+            image_path = match.group('html_img_src')
+
+        # The same images recur across pages, so symlink resolution is
+        # memoized per joined path (not normalized first, as collapsing
+        # '..' before resolving symlinks could point at a different file)
+        joined_path = os.path.join(current_dir, image_path)
+        resolved_path = resolved_paths.get(joined_path)
+        if resolved_path is None:
+            resolved_path = Path(joined_path).resolve()
+            resolved_paths[joined_path] = resolved_path
+
+        # Copy image and get new path
+        try:
+            new_path = self._copy_image(resolved_path)
+            copied.append(str(resolved_path))
+
+            # Convert to Hugo static URL
+            # Don't add /images/ prefix if path already starts with images/
+            if new_path.startswith('images/'):
+                hugo_url = f"/{new_path}"
+            else:
+                hugo_url = f"/images/{new_path}"
 
-        return markdown, copied
+            if is_markdown:
+                return f'![{match.group("md_img_alt")}]({hugo_url})'
+            return f'<img {match.group("html_img_prefix")}{hugo_url}{match.group("html_img_suffix")}>'
+        except Exception as e:
+            # Keep original if copy fails
+            print(f"Warning: Failed to copy image {image_path}: {e}")
+            return match.group(0)
 
     def _copy_image(self, source_path: Path) -> str:
         """
@@ -126,10 +141,12 @@ class ImageProcessor:
         """
         # Check if already copied
         source_str = str(source_path)
-        if source_str in self.copied_images:
-            return self.copied_images[source_str]
+        with self._lock:
+            if source_str in self.copied_images:
+                return self.copied_images[source_str]
 
-        if not source_path.exists():
+        src_stat = _stat_or_none(source_path)
+        if src_stat is None:
             raise FileNotFoundError(f"Image not found: {source_path}")
 
         if self.maintain_structure:
@@ -146,25 +163,78 @@ class ImageProcessor:
             dest_path = self.static_dir / source_path.name
 
         # Handle name conflicts
-        if dest_path.exists() and dest_path.stat().st_size != source_path.stat().st_size:
+        dest_stat = _stat_or_none(dest_path)
+        if dest_stat is not None and dest_stat.st_size != src_stat.st_size:
             # Add parent directory name to avoid conflicts
             stem = source_path.stem
             suffix = source_path.suffix
             parent_name = source_path.parent.name
             dest_path = self.static_dir / f"{parent_name}_{stem}{suffix}"
+            dest_stat = _stat_or_none(dest_path)
 
         # Create parent directories
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Copy image
-        shutil.copy2(source_path, dest_path)
+        self._place_file(source_path, dest_path, src_stat, dest_stat)
 
         # Store relative path for reuse
         relative_dest = dest_path.relative_to(self.static_dir)
-        self.copied_images[source_str] = str(relative_dest)
+        with self._lock:
+            self.copied_images[source_str] = str(relative_dest)
 
         return str(relative_dest)
 
+    def copy_file(self, source_path: Path, dest_path: Path):
+        """
+        Place a file at an explicit destination, the same way images are placed.
+
+        Use this instead of copying onto a destination in the static
+        directory, which may already be a hardlink to the source.
+
+        Args:
+            source_path: Source file path
+            dest_path: Destination file path
+        """
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._place_file(source_path, dest_path, source_path.stat(), _stat_or_none(dest_path))
+
+    def _place_file(
+        self,
+        source_path: Path,
+        dest_path: Path,
+        src_stat: os.stat_result,
+        dest_stat: Optional[os.stat_result]
+    ):
+        """
+        Place a copy of a source file at the destination path.
+
+        Hardlinks the file when enabled and supported, otherwise copies only
+        the file contents (Hugo does not need the source metadata).
+
+        Args:
+            source_path: Source file path
+            dest_path: Destination file path
+            src_stat: Stat result of the source file
+            dest_stat: Stat result of the destination, or None if missing
+        """
+        # Replace an existing file instead of writing through it, which would
+        # modify the source if it is a hardlink left by a previous build
+        if dest_stat is not None:
+            if os.path.samestat(src_stat, dest_stat):
+                return
+            dest_path.unlink()
+
+        if self.use_hardlinks:
+            try:
+                os.link(source_path, dest_path)
+                return
+            except OSError:
+                # Cross-device link or filesystem without hardlink support
+                pass
+
+        shutil.copyfile(source_path, dest_path)
+
     def copy_directory(self, images_dir: Path) -> int:
         """
         Copy an entire images directory.
@@ -178,47 +248,72 @@ class ImageProcessor:
         if not images_dir.exists():
             return 0
 
+        image_files = [
+            image_file for image_file in images_dir.rglob('*')
+            if image_file.is_file() and self._is_image(image_file)
+        ]
+
         # Temporarily change source_dir to images_dir to avoid path duplication
         original_source_dir = self.source_dir
         self.source_dir = images_dir
 
-        count = 0
-        for image_file in images_dir.rglob('*'):
-            if image_file.is_file() and self._is_image(image_file):
-                try:
-                    self._copy_image(image_file)
-                    count += 1
-                except Exception as e:
-                    print(f"Warning: Failed to copy {image_file}: {e}")
-
-        # Restore original source_dir
-        self.source_dir = original_source_dir
+        # Copying is I/O-bound, so overlap the file operations across threads
+        try:
+            max_workers = min(16, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                count = sum(executor.map(self._copy_image_safe, image_files))
+        finally:
+            # Restore original source_dir
+            self.source_dir = original_source_dir
 
         return count
 
+    def _copy_image_safe(self, image_file: Path) -> bool:
+        """Copy an image, reporting failures instead of raising."""
+        try:
+            self._copy_image(image_file)
+            return True
+        except Exception as e:
+            print(f"Warning: Failed to copy {image_file}: {e}")
+            return False
+
     def _is_image(self, file_path: Path) -> bool:
         """Check if a file is an image based on extension."""
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp', '.ico'}
-        return file_path.suffix.lower() in image_extensions
+        return file_path.suffix.lower() in _IMAGE_EXTENSIONS
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
 
 
 def process_images_in_markdown(
     markdown: str,
     current_file: Path,
     source_dir: Path,
-    static_dir: Path
+    static_dir: Path,
+    processor: Optional[ImageProcessor] = None
 ) -> Tuple[str, List[str]]:
     """
     Convenience function to process images in markdown.
 
+    Pass the same processor across calls (as HugoBuilder does for a whole
+    build) so images referenced from several pages are only copied once.
+
     Args:
         markdown: Markdown content
         current_file: Current file path
         source_dir: Source directory
         static_dir: Hugo static directory
+        processor: Existing ImageProcessor to reuse (a new one is created
+            for this call if omitted)
 
     Returns:
         Tuple of (updated_markdown, list_of_copied_images)
     """
-    processor = ImageProcessor(source_dir, static_dir)
+    if processor is None:
+        processor = ImageProcessor(source_dir, static_dir)
     return processor.process_images(markdown, current_file)
@@ -1,10 +1,32 @@
 """Rewrite links from Jupyter Book format to Hugo URLs."""
 
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
+import os
 import re
 from urllib.parse import urlparse, unquote
 
+from ..core.toc_parser import source_key
+from ..utils.slug import slugify
+
+# External links, anchors, and mailto links are left alone; the regex engine
+# rejects them so they never reach Python callbacks
+_SKIP_LINK = r'(?!https?://|mailto:|#)'
+
+# Markdown links: [text](url). Text starting with an image (a linked image
+# or badge, [![alt](src)](url)) is not matched at the outer bracket, so the
+# image itself is found one character later and processed as an image.
+_MD_LINK = rf'(?P<md_link>\[(?!!\[)(?P<md_link_text>[^\]]+)\]\({_SKIP_LINK}(?P<md_link_url>[^)]+)\))'
+
+# HTML <a> tags (the href=" matched must be the tag's last one)
+_HTML_LINK = (
+    r'(?P<html_link><a\s+(?P<html_link_prefix>[^>]*href=")(?![^>]*href=")'
+    rf'{_SKIP_LINK}(?P<html_link_url>[^"]+)(?P<html_link_suffix>"[^>]*)>)'
+)
+
+_LINK_PATTERN = re.compile(f'{_MD_LINK}|{_HTML_LINK}')
+
 
 class LinkRewriter:
     """Rewrite internal links for Hugo compatibility."""
@@ -23,6 +45,16 @@ class LinkRewriter:
         self.content_dir = content_dir
         self.broken_links = []
 
+        # Index mapping entries by filename for the fallback lookup. When
+        # several files share a name, the first one in TOC order wins.
+        self._stem_index = {}
+        for key, value in file_mapping.items():
+            self._stem_index.setdefault(Path(key).name, value)
+
+        # The same links recur across pages (navigation, cross-references),
+        # so resolved URLs are memoized per (url, directory)
+        self._cached_rewrite_url = lru_cache(maxsize=4096)(self._rewrite_url)
+
     def rewrite_links(self, markdown: str, current_file: Path) -> Tuple[str, List[str]]:
         """
         Rewrite all links in markdown content.
@@ -36,65 +68,60 @@ class LinkRewriter:
         """
         self.broken_links = []
 
-        # Pattern for markdown links: [text](url)
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        # Resolve relative links against the current file's directory
+        current_dir = current_file.parent if current_file.is_file() else current_file
 
-        def replace_link(match):
-            link_text = match.group(1)
-            link_url = match.group(2)
+        # Markdown links and HTML <a> tags are rewritten in a single scan
+        replace_link = partial(
+            self._replace_link_match, current_dir=current_dir, broken=self.broken_links
+        )
+        markdown = _LINK_PATTERN.sub(replace_link, markdown)
 
-            # Skip external links, anchors, and mailto links
-            if link_url.startswith(('http://', 'https://', 'mailto:', '#')):
-                return match.group(0)
-
-            # Skip Hugo shortcodes (already processed)
-            if '{{' in link_url and '}}' in link_url:
-                return match.group(0)
-
-            # Rewrite internal link
-            new_url = self._rewrite_url(link_url, current_file)
-
-            if new_url is None:
-                self.broken_links.append(link_url)
-                # Keep original link but mark it
-                return f'[{link_text}]({link_url} "⚠️ Broken link")'
-
-            return f'[{link_text}]({new_url})'
+        return markdown, self.broken_links
 
-        markdown = re.sub(link_pattern, replace_link, markdown)
+    def _replace_link_match(self, match: re.Match, current_dir: Path, broken: List[str]) -> str:
+        """
+        Rewrite a single link matched by _LINK_PATTERN.
 
-        # Also handle HTML <a> tags
-        html_link_pattern = r'<a\s+([^>]*href=")([^"]+)("[^>]*)>'
+        Args:
+            match: Match of a markdown link or HTML <a> tag
+            current_dir: Directory of the current source file
+            broken: List collecting the URLs of broken links
 
-        def replace_html_link(match):
-            prefix = match.group(1)
-            link_url = match.group(2)
-            suffix = match.group(3)
+        Returns:
+            Replacement text for the match
+        """
+        is_markdown = match.lastgroup == 'md_link'
+        if is_markdown:
+            link_url = match.group('md_link_url')
+        else:
+            link_url = match.group('html_link_url')
 
-            # Skip external links
-            if link_url.startswith(('http://', 'https://', 'mailto:', '#')):
-                return match.group(0)
+        # Skip Hugo shortcodes (already processed)
+        if is_markdown and '{{' in link_url and '}}' in link_url:
+            return match.group(0)
 
-            # Rewrite internal link
-            new_url = self._rewrite_url(link_url, current_file)
+        # Rewrite internal link
+        new_url = self._cached_rewrite_url(link_url, current_dir)
 
-            if new_url is None:
-                self.broken_links.append(link_url)
+        if new_url is None:
+            broken.append(link_url)
+            if not is_markdown:
                 return match.group(0)
+            # Keep original link but mark it
+            return f'[{match.group("md_link_text")}]({link_url} "⚠️ Broken link")'
 
-            return f'<a {prefix}{new_url}{suffix}>'
-
-        markdown = re.sub(html_link_pattern, replace_html_link, markdown)
-
-        return markdown, self.broken_links
+        if is_markdown:
+            return f'[{match.group("md_link_text")}]({new_url})'
+        return f'<a {match.group("html_link_prefix")}{new_url}{match.group("html_link_suffix")}>'
 
-    def _rewrite_url(self, url: str, current_file: Path) -> Optional[str]:
+    def _rewrite_url(self, url: str, current_dir: Path) -> Optional[str]:
         """
         Rewrite a single URL from Jupyter Book to Hugo format.
 
         Args:
             url: Original URL
-            current_file: Current file path (for resolving relatives)
+            current_dir: Directory of the current file (for resolving relatives)
 
         Returns:
             Rewritten URL or None if link is broken
@@ -115,9 +142,9 @@ class LinkRewriter:
             # Absolute path from source root
             target_path = self.source_dir / path_part.lstrip('/')
         else:
-            # Relative path from current file
-            current_dir = current_file.parent if current_file.is_file() else current_file
-            target_path = (current_dir / path_part).resolve()
+            # Relative path from current file; links only need lexical
+            # normalization, so avoid the filesystem access of resolve()
+            target_path = Path(os.path.normpath(os.path.join(current_dir, path_part)))
 
         # Normalize path
         try:
@@ -126,24 +153,22 @@ class LinkRewriter:
             # Path is outside source directory
             return None
 
-        # Remove extension for lookup
-        base_path = str(relative_to_source.with_suffix(''))
+        # Mapping keys are stored without their source extension
+        hugo_path = self.file_mapping.get(source_key(relative_to_source.as_posix()))
+
+        # Links may also use another extension (e.g. .html for the built
+        # page), which is only dropped after the dotted name was tried whole
+        has_suffix = bool(relative_to_source.suffix)
 
-        # Try to find in mapping with various extensions
-        hugo_path = None
-        for ext in ['', '.md', '.ipynb']:
-            lookup_key = f"{base_path}{ext}"
-            if lookup_key in self.file_mapping:
-                hugo_path = self.file_mapping[lookup_key]
-                break
+        if not hugo_path and has_suffix:
+            hugo_path = self.file_mapping.get(relative_to_source.with_suffix('').as_posix())
 
         if not hugo_path:
-            # Try just the filename
-            filename = relative_to_source.stem
-            for key, value in self.file_mapping.items():
-                if Path(key).stem == filename:
-                    hugo_path = value
-                    break
+            # Try just the filename (first file in TOC order with that name)
+            hugo_path = self._stem_index.get(source_key(relative_to_source.name))
+
+        if not hugo_path and has_suffix:
+            hugo_path = self._stem_index.get(relative_to_source.stem)
 
         if not hugo_path:
             return None
@@ -169,21 +194,20 @@ def build_file_mapping(toc, source_dir: Path, content_dir: Path) -> Dict[str, st
         content_dir: Hugo content directory
 
     Returns:
-        Dict mapping source paths to Hugo content paths
+        Dict mapping source paths (keyed with source_key) to Hugo content
+        paths
     """
     mapping = {}
 
     # Map root file
     if toc.root and toc.root.file:
         # Root becomes _index.md
-        mapping[toc.root.file] = "_index"
-        mapping[f"{toc.root.file}.md"] = "_index"
-        mapping[f"{toc.root.file}.ipynb"] = "_index"
+        mapping[source_key(toc.root.file)] = "_index"
 
     # Map all other files
     for part in toc.parts:
         # Create section slug from caption
-        section_slug = _slugify(part.caption)
+        section_slug = slugify(part.caption)
 
         for chapter in part.chapters:
             if chapter.file:
@@ -191,9 +215,7 @@ def build_file_mapping(toc, source_dir: Path, content_dir: Path) -> Dict[str, st
                 chapter_slug = Path(chapter.file).stem
                 hugo_path = f"{section_slug}/{chapter_slug}"
 
-                mapping[chapter.file] = hugo_path
-                mapping[f"{chapter.file}.md"] = hugo_path
-                mapping[f"{chapter.file}.ipynb"] = hugo_path
+                mapping[source_key(chapter.file)] = hugo_path
 
                 # Map sections
                 for section in chapter.sections:
@@ -201,21 +223,6 @@ def build_file_mapping(toc, source_dir: Path, content_dir: Path) -> Dict[str, st
                         section_slug_name = Path(section.file).stem
                         section_hugo_path = f"{section_slug}/{section_slug_name}"
 
-                        mapping[section.file] = section_hugo_path
-                        mapping[f"{section.file}.md"] = section_hugo_path
-                        mapping[f"{section.file}.ipynb"] = section_hugo_path
+                        mapping[source_key(section.file)] = section_hugo_path
 
     return mapping
-
-
-def _slugify(text: str) -> str:
-    """Convert text to a URL-friendly slug."""
-    # Convert to lowercase
-    slug = text.lower()
-
-    # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = slug.strip('-')
-
-    return slug
@@ -4,6 +4,65 @@ from pathlib import Path
 from typing import Tuple, Dict, Any, List
 import re
 
+# Markdown image references: ![alt](path). Only local paths are captured;
+# external URLs and data URIs match with an empty group.
+_IMAGE_REF_PATTERN = re.compile(r'!\[.*?\]\((?:(?:https?://|data:)[^)]*|([^)]+))\)')
+
+# Colon-fenced MyST directives, anchored to line boundaries to properly match
+# multiline directives:
+# :::{directive_type} [title]
+# :class: additional-class
+# :name: label
+# Content here
+# :::
+_COLON_DIRECTIVE = (
+    r'(?P<colon>^:::[ ]*(?:\{(?P<colon_type>[a-zA-Z-]+)\}|(?P<colon_bare_type>[a-zA-Z-]+))'
+    r'[ ]*(?P<colon_title>[^\n]*)\n(?P<colon_body>.*?)\n:::[ ]*$)'
+)
+
+# Match both ```{tableofcontents}``` and `````{tableofcontents}`````
+_TOC_DIRECTIVE = r'(?P<toc>`{3,}\{tableofcontents\}\s*\n?`{3,})'
+
+# MyST image directive: ```{image} path
+_IMAGE_DIRECTIVE = (
+    r'(?P<image>```\{image\}\s*(?P<image_path>[^\n]+)\n'
+    r'(?P<image_options>(?:---\n)?(?:.*?\n)?(?:---\n)?)```)'
+)
+
+# Backtick-fenced directives: ```{directive_type} title
+# Match 3 or more backticks to handle variants like `````
+_FENCED_DIRECTIVE = (
+    r'(?P<fenced>(?P<fence>`{3,})\{(?P<fenced_type>[a-zA-Z-]+)\}\s*(?P<fenced_title>[^\n]*)\n'
+    r'(?P<fenced_body>.*?)\n(?P=fence))'
+)
+
+# All directive forms, scanned in a single pass. Where several start at the
+# same position, the table of contents and image directives take precedence
+# over the generic fenced form. The leading lookahead lets the engine reject
+# most positions without trying each alternative.
+_DIRECTIVES_PATTERN = re.compile(
+    f'(?=[:`])(?:{_COLON_DIRECTIVE}|{_TOC_DIRECTIVE}|{_IMAGE_DIRECTIVE}|{_FENCED_DIRECTIVE})',
+    re.DOTALL | re.MULTILINE
+)
+
+# Directives that may appear inside a fenced directive
+_UNFENCED_DIRECTIVES_PATTERN = re.compile(
+    f'(?=[:`])(?:{_COLON_DIRECTIVE}|{_TOC_DIRECTIVE}|{_IMAGE_DIRECTIVE})',
+    re.DOTALL | re.MULTILINE
+)
+
+# Directive option line, e.g. ":class: warning"
+_OPTION_LINE = re.compile(r'[ \t]*:([\w-]+):[ \t]*([^\n]*)(?:\n|$)')
+
+# Jupyter Book cross-reference roles
+_XREF_PATTERN = re.compile(r'\{(doc|ref|cite)\}`([^`]+)`')
+
+# Broken link marker left in figure captions by the link rewriter
+_BROKEN_LINK_WARNING = re.compile(r'\s*"⚠️ Broken link"')
+
+# Figure captions go into a quoted shortcode parameter on a single line
+_CAPTION_ESCAPES = str.maketrans({'"': '&quot;', '\n': ' '})
+
 
 class MarkdownConverter:
     """Converter for MyST markdown to Hugo-compatible markdown."""
@@ -52,256 +111,330 @@ class MarkdownConverter:
 
     def _has_math(self, markdown: str) -> bool:
         """Check if markdown contains LaTeX math."""
-        return bool(re.search(r'\$.*?\$', markdown))
+        return _contains_math(markdown)
 
     def _extract_images(self, markdown: str) -> List[str]:
         """Extract image references from markdown."""
-        image_pattern = r'!\[.*?\]\(([^)]+)\)'
-        matches = re.findall(image_pattern, markdown)
-
-        images = []
-        for match in matches:
-            if not match.startswith(('http://', 'https://', 'data:')):
-                images.append(match)
-
-        return images
-
-    def _convert_directives(self, markdown: str, metadata: Dict) -> str:
-        """Convert MyST directives to Hugo shortcodes."""
-        # Pattern for MyST directives:
-        # :::{directive_type} [title]
-        # :class: additional-class
-        # :name: label
-        # Content here
-        # :::
-
-        # Pattern anchored to line boundaries to properly match multiline directives
-        directive_pattern = r'^:::[ ]*(?:\{([a-zA-Z-]+)\}|([a-zA-Z-]+))[ ]*([^\n]*)\n(.*?)\n:::[ ]*$'
-
-        def replace_directive(match):
-            directive_type = match.group(1) or match.group(2)
-            title = match.group(3).strip()
-            full_content = match.group(4)
-
-            # Parse options and content
-            lines = full_content.split('\n')
-            options_dict = {}
-            content_lines = []
-
-            for line in lines:
-                if line.strip().startswith(':') and ':' in line[1:]:
-                    # This is an option line
-                    parts = line.strip()[1:].split(':', 1)
-                    if len(parts) == 2:
-                        options_dict[parts[0].strip()] = parts[1].strip()
-                else:
-                    content_lines.append(line)
-
-            content = '\n'.join(content_lines).strip()
-
-            # Get class from options
-            css_class = options_dict.get('class', '')
-
-            # Convert to Hugo shortcode
-            if directive_type in self.DIRECTIVE_TYPES:
-                shortcode_type = self.DIRECTIVE_TYPES[directive_type]
-                metadata['directives_converted'].append(directive_type)
-
-                if shortcode_type == 'figure':
-                    # For figure directives, title is the image path
-                    image_path = title
-                    caption = content.strip()
-
-                    # Normalize image path for Hugo static files
-                    if not image_path.startswith(('http://', 'https://', 'data:', '/')):
-                        # Local image path - convert to Hugo static URL
-                        # Remove ../ and ./ prefixes
-                        clean_path = image_path.lstrip('./')
-                        while clean_path.startswith('../'):
-                            clean_path = clean_path[3:]
-                        # If path starts with 'images/', keep it; otherwise add /images/
-                        if clean_path.startswith('images/'):
-                            image_path = f'/{clean_path}'
-                        else:
-                            image_path = f'/images/{clean_path}'
-
-                    # Convert to Hugo figure shortcode or markdown image
-                    if caption:
-                        # Use Hugo figure shortcode with caption
-                        params = [f'src="{image_path}"']
-                        if caption:
-                            # Remove broken link warnings from caption
-                            caption = re.sub(r'\s*"⚠️ Broken link"', '', caption)
-                            # Escape quotes in caption and clean newlines
-                            escaped_caption = caption.replace('"', '&quot;').replace('\n', ' ').strip()
-                            params.append(f'caption="{escaped_caption}"')
-                        param_str = ' '.join(params)
-                        return f'{{{{< figure {param_str} >}}}}'
-                    else:
-                        # Simple markdown image
-                        return f'![{caption}]({image_path})'
-
-                elif shortcode_type == 'admonition':
-                    # Build shortcode parameters
-                    params = [f'type="{directive_type}"']
-                    if title:
-                        # Escape quotes in title
-                        escaped_title = title.replace('"', '\\"')
-                        params.append(f'title="{escaped_title}"')
-                    if css_class:
-                        params.append(f'class="{css_class}"')
+        return _extract_local_images(markdown)
+
+    def _convert_directives(
+        self,
+        markdown: str,
+        metadata: Dict,
+        pattern: re.Pattern = _DIRECTIVES_PATTERN
+    ) -> str:
+        """
+        Convert MyST directives to Hugo shortcodes.
 
-                    param_str = ' '.join(params)
-                    return f'{{{{< admonition {param_str} >}}}}\n{content}\n{{{{< /admonition >}}}}'
-
-                elif shortcode_type == 'details':
-                    # Convert dropdown/toggle to HTML details element
-                    # Hugo doesn't have a built-in shortcode for this, but HTML details works
-                    summary_text = title if title else "Click to expand"
-                    return f'<details>\n<summary>{summary_text}</summary>\n\n{content}\n</details>'
-
-                elif shortcode_type == 'bibliography':
-                    # Remove bibliography directive - Hugo typically uses different reference system
-                    # Just output the content without the directive wrapper
-                    return content
+        Args:
+            markdown: Markdown content
+            metadata: Conversion metadata to record converted directives in
+            pattern: Directive pattern to scan for
+
+        Returns:
+            Markdown with directives converted
+        """
+        # Every directive form starts with ::: or ```{ (also found in
+        # ````{), so most notebook cells and directive bodies skip the scan
+        if ':::' not in markdown and '```{' not in markdown:
+            return markdown
+
+        pieces = []
+        pos = 0
+
+        # All directive forms are converted in one scan; nested directives
+        # are handled by converting the matched content recursively
+        for match in pattern.finditer(markdown):
+            kind = match.lastgroup
+            if kind == 'colon':
+                replacement = self._replace_colon_directive(match, metadata)
+            elif kind == 'toc':
+                # Remove it as Hugo uses the menu system
+                replacement = ''
+            elif kind == 'image':
+                replacement = self._replace_image_directive(match)
             else:
-                # Unknown directive - convert to HTML div for fallback
-                css_classes = f"directive {directive_type}"
-                if css_class:
-                    css_classes += f" {css_class}"
-
-                html = f'<div class="{css_classes}">'
-                if title:
-                    html += f'<p class="admonition-title">{title}</p>'
-                html += f'\n{content}\n</div>'
-                return html
-
-        # Apply the conversion
-        markdown = re.sub(directive_pattern, replace_directive, markdown, flags=re.DOTALL | re.MULTILINE)
-
-        # Also handle simpler format: ```{directive_type} title
-        # Match 3 or more backticks to handle variants like `````
-        simple_directive_pattern = r'(`{3,})\{([a-zA-Z-]+)\}\s*([^\n]*)\n(.*?)\n\1'
-
-        def replace_simple_directive(match):
-            # Group 1 is the backticks (for matching closing), group 2 is directive_type
-            directive_type = match.group(2)
-            title = match.group(3).strip()
-            full_content = match.group(4).strip()
-
-            if directive_type in self.DIRECTIVE_TYPES:
-                metadata['directives_converted'].append(directive_type)
-
-                # Parse options and content (same as main directive handler)
-                lines = full_content.split('\n')
-                options_dict = {}
-                content_lines = []
-
-                for line in lines:
-                    if line.strip().startswith(':') and ':' in line[1:]:
-                        # This is an option line
-                        parts = line.strip()[1:].split(':', 1)
-                        if len(parts) == 2:
-                            options_dict[parts[0].strip()] = parts[1].strip()
+                replacement = self._replace_fenced_directive(match, metadata)
+
+            pieces.append(markdown[pos:match.start()])
+            pieces.append(replacement)
+            pos = match.end()
+
+        if not pieces:
+            return markdown
+
+        pieces.append(markdown[pos:])
+        return ''.join(pieces)
+
+    def _replace_colon_directive(self, match: re.Match, metadata: Dict) -> str:
+        """Convert a :::{directive} block."""
+        directive_type = match.group('colon_type') or match.group('colon_bare_type')
+        title = match.group('colon_title').strip()
+        full_content = match.group('colon_body')
+
+        # Parse options and content
+        options_dict, content = _split_options(full_content)
+        content = content.strip()
+
+        # Get class from options
+        css_class = options_dict.get('class', '')
+
+        # Convert to Hugo shortcode
+        if directive_type in _SUPPORTED_TYPES:
+            metadata['directives_converted'].append(directive_type)
+
+            if directive_type in _FIGURE_TYPES:
+                # For figure directives, title is the image path
+                image_path = title
+                caption = content.strip()
+
+                # Normalize image path for Hugo static files
+                if not image_path.startswith(('http://', 'https://', 'data:', '/')):
+                    # Local image path - convert to Hugo static URL
+                    # Remove ../ and ./ prefixes (lstrip drops every leading
+                    # '.' and '/', so no '../' can remain afterwards)
+                    clean_path = image_path.lstrip('./')
+                    # If path starts with 'images/', keep it; otherwise add /images/
+                    if clean_path.startswith('images/'):
+                        image_path = f'/{clean_path}'
                     else:
-                        content_lines.append(line)
+                        image_path = f'/images/{clean_path}'
 
-                content = '\n'.join(content_lines).strip()
-                css_class = options_dict.get('class', '')
+                # Convert to Hugo figure shortcode or markdown image
+                if caption:
+                    # Use Hugo figure shortcode with caption
+                    params = [f'src="{image_path}"']
+                    if caption:
+                        # Remove broken link warnings from caption
+                        caption = _BROKEN_LINK_WARNING.sub('', caption)
+                        # Escape quotes in caption and clean newlines
+                        escaped_caption = caption.translate(_CAPTION_ESCAPES).strip()
+                        params.append(f'caption="{escaped_caption}"')
+                    param_str = ' '.join(params)
+                    return f'{{{{< figure {param_str} >}}}}'
+                else:
+                    # Simple markdown image
+                    return f'![{caption}]({image_path})'
+
+            # Directives nested in the content (figure captions stay verbatim)
+            content = self._convert_directives(content, metadata)
+
+            if directive_type in _ADMONITION_TYPES:
+                # Escape quotes in title
+                return _admonition(directive_type, title.replace('"', '\\"'), css_class, content)
+
+            elif directive_type in _DETAILS_TYPES:
+                # Convert dropdown/toggle to HTML details element
+                # Hugo doesn't have a built-in shortcode for this, but HTML details works
+                summary_text = title if title else "Click to expand"
+                return f'<details>\n<summary>{summary_text}</summary>\n\n{content}\n</details>'
+
+            elif directive_type in _BIBLIOGRAPHY_TYPES:
+                # Remove bibliography directive - Hugo typically uses different reference system
+                # Just output the content without the directive wrapper
+                return content
+        else:
+            # Unknown directive - convert to HTML div for fallback
+            content = self._convert_directives(content, metadata)
+
+            css_classes = f"directive {directive_type}"
+            if css_class:
+                css_classes += f" {css_class}"
+
+            html = f'<div class="{css_classes}">'
+            if title:
+                html += f'<p class="admonition-title">{title}</p>'
+            html += f'\n{content}\n</div>'
+            return html
+
+    def _replace_fenced_directive(self, match: re.Match, metadata: Dict) -> str:
+        """Convert a ```{directive} block."""
+        directive_type = match.group('fenced_type')
+
+        if directive_type not in _SUPPORTED_TYPES:
+            # Fallback - treat as code block, converting only the directive
+            # forms that may appear inside one
+            return self._convert_directives(
+                match.group(0), metadata, _UNFENCED_DIRECTIVES_PATTERN
+            )
+
+        title = match.group('fenced_title').strip()
+        full_content = self._convert_directives(
+            match.group('fenced_body'), metadata, _UNFENCED_DIRECTIVES_PATTERN
+        ).strip()
+
+        metadata['directives_converted'].append(directive_type)
+
+        # Parse options and content (same as colon directive handler)
+        options_dict, content = _split_options(full_content)
+        content = content.strip()
+        css_class = options_dict.get('class', '')
+
+        if directive_type in _ADMONITION_TYPES:
+            return _admonition(directive_type, title, css_class, content)
+
+        elif directive_type in _DETAILS_TYPES:
+            summary_text = title if title else "Click to expand"
+            return f'<details>\n<summary>{summary_text}</summary>\n\n{content}\n</details>'
+
+        elif directive_type in _BIBLIOGRAPHY_TYPES:
+            return content
+
+        else:
+            # Fallback for other types
+            shortcode_type = self.DIRECTIVE_TYPES[directive_type]
+            return f'{{{{< {shortcode_type} >}}}}\n{content}\n{{{{< /{shortcode_type} >}}}}'
+
+    def _replace_image_directive(self, match: re.Match) -> str:
+        """Convert a ```{image} block."""
+        image_path = match.group('image_path').strip()
+        options = match.group('image_options').strip()
+
+        # Parse options
+        alt_text = ""
+        width = ""
+        if options:
+            for line in options.split('\n'):
+                if line.startswith('alt:'):
+                    alt_text = line.split(':', 1)[1].strip()
+                elif line.startswith('width:'):
+                    width = line.split(':', 1)[1].strip()
+
+        # Convert to markdown image or Hugo figure shortcode
+        if width or alt_text:
+            # Use Hugo figure shortcode for better control
+            params = [f'src="{image_path}"']
+            if alt_text:
+                params.append(f'alt="{alt_text}"')
+            if width:
+                params.append(f'width="{width}"')
+            param_str = ' '.join(params)
+            return f'{{{{< figure {param_str} >}}}}'
+        else:
+            # Simple markdown image
+            return f'![{alt_text}]({image_path})'
 
-                # Get shortcode type and handle accordingly
-                shortcode_type = self.DIRECTIVE_TYPES[directive_type]
+    def _convert_cross_references(self, markdown: str) -> str:
+        """Convert Jupyter Book cross-references to Hugo."""
+        if '{doc}' not in markdown and '{ref}' not in markdown and '{cite}' not in markdown:
+            return markdown
 
-                if shortcode_type == 'admonition':
-                    params = [f'type="{directive_type}"']
-                    if title:
-                        params.append(f'title="{title}"')
-                    if css_class:
-                        params.append(f'class="{css_class}"')
-                    param_str = ' '.join(params)
-                    return f'{{{{< admonition {param_str} >}}}}\n{content}\n{{{{< /admonition >}}}}'
+        # All three roles are converted in a single scan
+        return _XREF_PATTERN.sub(_replace_cross_reference, markdown)
 
-                elif shortcode_type == 'details':
-                    summary_text = title if title else "Click to expand"
-                    return f'<details>\n<summary>{summary_text}</summary>\n\n{content}\n</details>'
 
-                elif shortcode_type == 'bibliography':
-                    return content
+def _split_options(content: str) -> Tuple[Dict[str, str], str]:
+    """
+    Split the leading option lines off a directive's content.
 
-                else:
-                    # Fallback for other types
-                    return f'{{{{< {shortcode_type} >}}}}\n{content}\n{{{{< /{shortcode_type} >}}}}'
-
-            # Fallback - treat as code block
-            return match.group(0)
-
-        markdown = re.sub(simple_directive_pattern, replace_simple_directive, markdown, flags=re.DOTALL)
-
-        # Handle MyST image directive: ```{image} path
-        image_directive_pattern = r'```\{image\}\s*([^\n]+)\n((?:---\n)?(?:.*?\n)?(?:---\n)?)```'
-
-        def replace_image_directive(match):
-            image_path = match.group(1).strip()
-            options = match.group(2).strip()
-
-            # Parse options
-            alt_text = ""
-            width = ""
-            if options:
-                for line in options.split('\n'):
-                    if line.startswith('alt:'):
-                        alt_text = line.split(':', 1)[1].strip()
-                    elif line.startswith('width:'):
-                        width = line.split(':', 1)[1].strip()
-
-            # Convert to markdown image or Hugo figure shortcode
-            if width or alt_text:
-                # Use Hugo figure shortcode for better control
-                params = [f'src="{image_path}"']
-                if alt_text:
-                    params.append(f'alt="{alt_text}"')
-                if width:
-                    params.append(f'width="{width}"')
-                param_str = ' '.join(params)
-                return f'{{{{< figure {param_str} >}}}}'
-            else:
-                # Simple markdown image
-                return f'![{alt_text}]({image_path})'
+    Options are only recognized directly at the start of the content, so
+    lines further down that happen to start with a colon are kept.
 
-        markdown = re.sub(image_directive_pattern, replace_image_directive, markdown, flags=re.DOTALL)
+    Args:
+        content: Directive content following the directive line
 
-        # Handle {tableofcontents} directive - remove it as Hugo uses menu system
-        # Match both ```{tableofcontents}``` and `````{tableofcontents}`````
-        toc_pattern = r'`{3,}\{tableofcontents\}\s*\n?`{3,}'
-        markdown = re.sub(toc_pattern, '', markdown)
+    Returns:
+        Tuple of (options_dict, remaining_content)
+    """
+    options = {}
+    pos = 0
+    # Match anchored at each line start; searching would scan the whole body
+    match = _OPTION_LINE.match(content)
+    while match:
+        options[match.group(1)] = match.group(2).strip()
+        pos = match.end()
+        match = _OPTION_LINE.match(content, pos)
+    return options, content[pos:]
+
+
+def _admonition(directive_type: str, title: str, css_class: str, content: str) -> str:
+    """
+    Build an admonition shortcode.
 
-        return markdown
+    Args:
+        directive_type: Admonition directive type (note, warning, ...)
+        title: Title parameter, already escaped (omitted if empty)
+        css_class: Class parameter (omitted if empty)
+        content: Converted admonition content
+
+    Returns:
+        Admonition shortcode wrapping the content
+    """
+    shortcode = _ADMONITION_OPEN[directive_type]
+    if title:
+        shortcode += f' title="{title}"'
+    if css_class:
+        shortcode += f' class="{css_class}"'
+    return f'{shortcode} >}}}}\n{content}{_ADMONITION_CLOSE}'
 
-    def _convert_cross_references(self, markdown: str) -> str:
-        """Convert Jupyter Book cross-references to Hugo."""
-        # Convert {doc}`path/to/file` to Hugo relref
-        markdown = re.sub(
-            r'\{doc\}`([^`]+)`',
-            lambda m: f'[{{{{< relref "{m.group(1)}" >}}}}]({{{{< relref "{m.group(1)}" >}}}})',
-            markdown
-        )
 
+def _replace_cross_reference(match: re.Match) -> str:
+    """Convert a single {doc}, {ref} or {cite} role."""
+    role, target = match.groups()
+
+    if role == 'doc':
+        # Convert {doc}`path/to/file` to Hugo relref
+        return f'[{{{{< relref "{target}" >}}}}]({{{{< relref "{target}" >}}}})'
+    if role == 'ref':
         # Convert {ref}`label` to Hugo ref
-        markdown = re.sub(
-            r'\{ref\}`([^`]+)`',
-            lambda m: f'[{{{{< ref "{m.group(1)}" >}}}}]({{{{< ref "{m.group(1)}" >}}}})',
-            markdown
-        )
+        return f'[{{{{< ref "{target}" >}}}}]({{{{< ref "{target}" >}}}})'
 
-        # Convert {cite}`key` to plain text citation (Hugo uses different citation system)
-        # Just convert to [key] format as a fallback
-        markdown = re.sub(
-            r'\{cite\}`([^`]+)`',
-            lambda m: f'[{m.group(1)}]',
-            markdown
-        )
+    # Convert {cite}`key` to plain text citation (Hugo uses different citation system)
+    # Just convert to [key] format as a fallback
+    return f'[{target}]'
 
-        return markdown
+
+def _contains_math(markdown: str) -> bool:
+    """
+    Check for a pair of $ delimiters on the same line ($...$ or $$...$$).
+
+    Gives the same result as the previous non-DOTALL regex search, using
+    substring searches instead of the regex engine.
+    """
+    start = markdown.find('$')
+    while start != -1:
+        end = markdown.find('$', start + 1)
+        if end == -1:
+            return False
+        if markdown.find('\n', start + 1, end) == -1:
+            return True
+        # A newline separates this pair; the closing $ may open the next one
+        start = end
+    return False
+
+
+def _extract_local_images(markdown: str) -> List[str]:
+    """Extract local image paths (not URLs or data URIs) from markdown."""
+    if '![' not in markdown:
+        return []
+    return list(filter(None, _IMAGE_REF_PATTERN.findall(markdown)))
+
+
+def _directive_types(shortcode_type: str) -> frozenset:
+    """Get the directive types that convert to the given shortcode type."""
+    return frozenset(
+        directive_type
+        for directive_type, kind in MarkdownConverter.DIRECTIVE_TYPES.items()
+        if kind == shortcode_type
+    )
+
+
+# Directive types grouped by how they are converted
+_SUPPORTED_TYPES = frozenset(MarkdownConverter.DIRECTIVE_TYPES)
+_ADMONITION_TYPES = _directive_types('admonition')
+_DETAILS_TYPES = _directive_types('details')
+_FIGURE_TYPES = _directive_types('figure')
+_BIBLIOGRAPHY_TYPES = _directive_types('bibliography')
+
+# Admonition shortcode openings per type, up to the optional parameters
+_ADMONITION_OPEN = {
+    directive_type: f'{{{{< admonition type="{directive_type}"'
+    for directive_type in _ADMONITION_TYPES
+}
+_ADMONITION_CLOSE = '\n{{< /admonition >}}'
+
+# The converter keeps no per-document state, so one instance is shared
+_converter = MarkdownConverter()
 
 
 def convert_markdown(markdown_path: Path) -> Tuple[str, Dict[str, Any]]:
@@ -317,8 +450,7 @@ def convert_markdown(markdown_path: Path) -> Tuple[str, Dict[str, Any]]:
     with open(markdown_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    converter = MarkdownConverter()
-    return converter.convert(content)
+    return _converter.convert(content)
 
 
 def convert_markdown_string(markdown_content: str) -> Tuple[str, Dict[str, Any]]:
@@ -331,5 +463,4 @@ def convert_markdown_string(markdown_content: str) -> Tuple[str, Dict[str, Any]]
     Returns:
         Tuple of (converted_markdown, metadata)
     """
-    converter = MarkdownConverter()
-    return converter.convert(markdown_content)
+    return _converter.convert(markdown_content)
@@ -0,0 +1,59 @@
+"""Rewrite images and links in Hugo markdown in a single pass."""
+
+from pathlib import Path
+from typing import List, Tuple
+import re
+
+from .image_processor import ImageProcessor, _MD_IMG, _HTML_IMG
+from .link_rewriter import LinkRewriter, _MD_LINK, _HTML_LINK
+
+# Images come first so that ![alt](src) is never also treated as a link (a
+# link whose text starts with an image is not matched; see _MD_LINK)
+_REWRITE_PATTERN = re.compile(f'{_MD_IMG}|{_HTML_IMG}|{_MD_LINK}|{_HTML_LINK}')
+
+_IMAGE_GROUPS = frozenset({'md_img', 'html_img'})
+
+
+class MarkdownRewriter:
+    """Process images and rewrite internal links with one scan per page."""
+
+    def __init__(self, image_processor: ImageProcessor, link_rewriter: LinkRewriter):
+        """
+        Initialize the markdown rewriter.
+
+        Args:
+            image_processor: Image processor that copies referenced images
+            link_rewriter: Link rewriter that maps internal links to Hugo URLs
+        """
+        self.image_processor = image_processor
+        self.link_rewriter = link_rewriter
+
+    def rewrite(self, markdown: str, current_file: Path) -> Tuple[str, List[str], List[str]]:
+        """
+        Process images and rewrite links in markdown content.
+
+        Args:
+            markdown: Markdown content
+            current_file: Path to the current source file
+
+        Returns:
+            Tuple of (rewritten_markdown, list_of_copied_images, list_of_broken_links)
+        """
+        copied = []
+        broken = []
+
+        # Resolve relative images and links against the current file's directory
+        current_dir = current_file.parent if current_file.is_file() else current_file
+        current_dir_str = str(current_dir)
+
+        replace_image = self.image_processor._replace_image_match
+        replace_link = self.link_rewriter._replace_link_match
+
+        def replace(match):
+            if match.lastgroup in _IMAGE_GROUPS:
+                return replace_image(match, current_dir_str, copied)
+            return replace_link(match, current_dir, broken)
+
+        markdown = _REWRITE_PATTERN.sub(replace, markdown)
+
+        return markdown, copied, broken
@@ -1,13 +1,34 @@
 """Convert Jupyter notebooks to Hugo-compatible markdown."""
 
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
+import os
 import re
 from nbconvert import MarkdownExporter
 from nbconvert.preprocessors import Preprocessor
 from traitlets import Unicode
 import nbformat
 
+from .markdown_converter import convert_markdown_string
+
+# YouTube iframe embeds
+_IFRAME_PATTERN = re.compile(
+    r'<iframe[^>]*src=["\']https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]+)["\'][^>]*>.*?</iframe>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# YouTube thumbnail links that should be embedded:
+# [![...](https://img.youtube.com/vi/VIDEO_ID/...)](https://www.youtube.com/watch?v=VIDEO_ID)
+_YOUTUBE_LINK_PATTERN = re.compile(
+    r'\[!\[([^\]]*)\]\(https?://img\.youtube\.com/vi/([a-zA-Z0-9_-]+)[^\)]*\)\]'
+    r'\(https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)\)'
+)
+
+# First level-one heading
+_HEADING_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
 
 class HugoPreprocessor(Preprocessor):
     """Preprocessor to handle Hugo-specific conversions."""
@@ -23,49 +44,30 @@ class HugoPreprocessor(Preprocessor):
             # Extract YouTube embeds and convert to shortcodes
             cell.source = self._convert_youtube_embeds(cell.source, resources)
 
-            # Handle Jupyter Book specific syntax
-            cell.source = self._convert_jb_syntax(cell.source)
-
         return cell, resources
 
     def _convert_youtube_embeds(self, source: str, resources: Dict) -> str:
         """Convert YouTube iframes and markdown links to Hugo shortcodes."""
+        # Most cells embed no videos. Both patterns need a URL, and the
+        # iframe one ignores case, so only lowercase cells that have a URL.
+        if '://' not in source or 'youtube' not in source.lower():
+            return source
+
         # Pattern 1: iframe embeds
-        iframe_pattern = r'<iframe[^>]*src=["\']https?://(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]+)["\'][^>]*>.*?</iframe>'
         def replace_iframe(match):
             video_id = match.group(1)
             resources['youtube_embeds'].append(video_id)
             return f'{{{{< youtube {video_id} >}}}}'
 
-        source = re.sub(iframe_pattern, replace_iframe, source, flags=re.DOTALL | re.IGNORECASE)
+        source = _IFRAME_PATTERN.sub(replace_iframe, source)
 
         # Pattern 2: YouTube links that should be embedded
-        # [![...](https://img.youtube.com/vi/VIDEO_ID/...)](https://www.youtube.com/watch?v=VIDEO_ID)
-        youtube_link_pattern = r'\[!\[([^\]]*)\]\(https?://img\.youtube\.com/vi/([a-zA-Z0-9_-]+)[^\)]*\)\]\(https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)\)'
         def replace_youtube_link(match):
             video_id = match.group(2)  # From thumbnail URL
             resources['youtube_embeds'].append(video_id)
             return f'{{{{< youtube {video_id} >}}}}'
 
-        source = re.sub(youtube_link_pattern, replace_youtube_link, source)
-
-        return source
-
-    def _convert_jb_syntax(self, source: str) -> str:
-        """Convert Jupyter Book specific syntax."""
-        # Convert {doc}`path/to/file` to Hugo relref
-        source = re.sub(
-            r'\{doc\}`([^`]+)`',
-            r'[{{\< relref "\1" >\}}]({{< relref "\1" >}})',
-            source
-        )
-
-        # Convert {ref}`label` to Hugo ref
-        source = re.sub(
-            r'\{ref\}`([^`]+)`',
-            r'[{{\< ref "\1" >\}}]({{< ref "\1" >}})',
-            source
-        )
+        source = _YOUTUBE_LINK_PATTERN.sub(replace_youtube_link, source)
 
         return source
 
@@ -88,30 +90,30 @@ class NotebookConverter:
         Returns:
             Tuple of (markdown_content, metadata_dict)
         """
-        # Read the notebook
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            nb = nbformat.read(f, as_version=4)
+        # Read the notebook in one binary read and decode it in one step,
+        # rather than parsing JSON from a text-mode stream
+        nb = nbformat.reads(notebook_path.read_bytes().decode('utf-8'), as_version=4)
 
         # Convert to markdown
         (body, resources) = self.exporter.from_notebook_node(nb)
 
+        # Post-process markdown
+        body = self._post_process_markdown(body)
+
+        # Apply MyST directive conversion. The converter already scans the
+        # body for math and images, so its results are reused rather than
+        # scanning the body again here.
+        body_converted, myst_metadata = convert_markdown_string(body)
+
         # Extract metadata
         metadata = {
             'title': self._extract_title(nb, body),
             'youtube_embeds': resources.get('youtube_embeds', []),
             'has_code': self._has_code_cells(nb),
-            'has_math': self._has_math(body),
-            'images': self._extract_images(body),
+            'has_math': myst_metadata['has_math'],
+            'images': myst_metadata['images'],
         }
 
-        # Post-process markdown
-        body = self._post_process_markdown(body)
-
-        # Apply MyST directive conversion
-        from .markdown_converter import MarkdownConverter
-        converter = MarkdownConverter()
-        body_converted, myst_metadata = converter.convert(body)
-
         # Merge metadata
         if myst_metadata.get('directives_converted'):
             metadata['directives_converted'] = myst_metadata['directives_converted']
@@ -125,7 +127,7 @@ class NotebookConverter:
             return nb.metadata['title']
 
         # Try to extract from first heading in markdown
-        heading_match = re.search(r'^#\s+(.+)$', markdown, re.MULTILINE)
+        heading_match = _HEADING_PATTERN.search(markdown)
         if heading_match:
             return heading_match.group(1).strip()
 
@@ -135,25 +137,6 @@ class NotebookConverter:
         """Check if notebook has code cells."""
         return any(cell.cell_type == 'code' for cell in nb.cells)
 
-    def _has_math(self, markdown: str) -> bool:
-        """Check if markdown contains LaTeX math."""
-        # Check for $...$ or $$...$$ patterns
-        return bool(re.search(r'\$.*?\$', markdown))
-
-    def _extract_images(self, markdown: str) -> List[str]:
-        """Extract image references from markdown."""
-        # Match ![alt](path) pattern
-        image_pattern = r'!\[.*?\]\(([^)]+)\)'
-        matches = re.findall(image_pattern, markdown)
-
-        # Filter out external URLs, keep local paths
-        images = []
-        for match in matches:
-            if not match.startswith(('http://', 'https://', 'data:')):
-                images.append(match)
-
-        return images
-
     def _post_process_markdown(self, markdown: str) -> str:
         """Post-process markdown for Hugo compatibility."""
         # Remove notebook-specific formatting that doesn't work well in Hugo
@@ -172,5 +155,41 @@ def convert_notebook(notebook_path: Path) -> Tuple[str, Dict[str, Any]]:
     Returns:
         Tuple of (markdown_content, metadata)
     """
-    converter = NotebookConverter()
-    return converter.convert(notebook_path)
+    return _shared_converter().convert(notebook_path)
+
+
+def convert_notebooks(
+    notebook_paths: List[Path],
+    workers: Optional[int] = None
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Convert several notebooks in parallel worker processes.
+
+    Notebook conversion is CPU-bound and each notebook is independent, so
+    the work is spread over a process pool to use all cores.
+
+    Args:
+        notebook_paths: Paths to .ipynb files
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        List of (markdown_content, metadata) tuples in the order of
+        notebook_paths
+    """
+    workers = min(workers or os.cpu_count() or 1, len(notebook_paths))
+
+    # Not worth starting processes for a single notebook
+    if workers <= 1:
+        return [convert_notebook(path) for path in notebook_paths]
+
+    chunksize = max(1, len(notebook_paths) // (workers * 4))
+    with Pool(workers) as pool:
+        return list(pool.imap(convert_notebook, notebook_paths, chunksize=chunksize))
+
+
+@lru_cache(maxsize=None)
+def _shared_converter() -> NotebookConverter:
+    """Get the converter shared by all conversions in this process."""
+    # Setting up the exporter and its preprocessors is costly, and the
+    # converter keeps no per-notebook state, so build it once per process
+    return NotebookConverter()
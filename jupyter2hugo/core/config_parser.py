@@ -3,7 +3,9 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-import yaml
+import copy
+
+from .yaml_cache import load_yaml_cached
 
 
 @dataclass
@@ -52,14 +54,17 @@ class JupyterBookConfig:
 class ConfigParser:
     """Parser for Jupyter Book _config.yml files."""
 
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, cache_dir: Optional[Path] = None):
         """
         Initialize the config parser.
 
         Args:
             config_path: Path to the _config.yml file
+            cache_dir: Directory for caching the parsed YAML between builds
+                (see load_yaml_cached)
         """
         self.config_path = config_path
+        self.cache_dir = cache_dir
         self.config_dir = config_path.parent
 
     def parse(self) -> JupyterBookConfig:
@@ -69,8 +74,9 @@ class ConfigParser:
         Returns:
             JupyterBookConfig object with parsed configuration
         """
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        # Parsed configs are cached per file version; each caller gets its
+        # own copy, as raw_config is handed out as-is
+        data = copy.deepcopy(load_yaml_cached(self.config_path, self.cache_dir)) or {}
 
         # Extract basic metadata
         title = data.get('title', '')
@@ -78,14 +84,14 @@ class ConfigParser:
         logo = data.get('logo')
         description = data.get('description')
         copyright_text = data.get('copyright')
-        license_info = None
 
         # Handle license (can be a string or dict)
-        license_data = data.get('license', {})
-        if isinstance(license_data, str):
-            license_info = license_data
-        elif isinstance(license_data, dict):
-            license_info = license_data.get('code') or license_data.get('text')
+        license_data = data.get('license')
+        license_info = (
+            license_data if isinstance(license_data, str)
+            else (license_data.get('code') or license_data.get('text')) if isinstance(license_data, dict)
+            else None
+        )
 
         # Handle authors (can be a string, list, or list of dicts)
         authors = []
@@ -105,15 +111,11 @@ class ConfigParser:
             authors = [author] if isinstance(author, str) else author
 
         # Extract repository information
-        repo_url = None
-        repo_branch = None
-        if 'repository' in data:
-            repo_data = data['repository']
-            if isinstance(repo_data, dict):
-                repo_url = repo_data.get('url')
-                repo_branch = repo_data.get('branch', 'main')
-            elif isinstance(repo_data, str):
-                repo_url = repo_data
+        repo_data = data.get('repository')
+        if isinstance(repo_data, dict):
+            repo_url, repo_branch = repo_data.get('url'), repo_data.get('branch', 'main')
+        else:
+            repo_url, repo_branch = (repo_data if isinstance(repo_data, str) else None), None
 
         # Language
         language = 'en'
@@ -158,15 +160,16 @@ class ConfigParser:
         return None
 
 
-def load_config(config_path: Path) -> JupyterBookConfig:
+def load_config(config_path: Path, cache_dir: Optional[Path] = None) -> JupyterBookConfig:
     """
     Convenience function to load and parse a _config.yml file.
 
     Args:
         config_path: Path to _config.yml
+        cache_dir: Directory for caching the parsed YAML between builds
 
     Returns:
         Parsed JupyterBookConfig
     """
-    parser = ConfigParser(config_path)
+    parser = ConfigParser(config_path, cache_dir)
     return parser.parse()
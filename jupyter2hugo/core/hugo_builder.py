@@ -1,25 +1,49 @@
 """Main orchestrator for converting Jupyter Book to Hugo."""
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-import shutil
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import sys
+import os
+import re
+
+from .. import __version__
 
 from ..core.toc_parser import load_toc
 from ..core.config_parser import load_config
-from ..converters.notebook_converter import convert_notebook
 from ..converters.markdown_converter import convert_markdown
 from ..converters.link_rewriter import LinkRewriter, build_file_mapping
 from ..converters.image_processor import ImageProcessor
-from ..hugo.frontmatter import FrontMatterBuilder, add_frontmatter, extract_title_from_markdown, remove_first_heading
+from ..converters.markdown_rewriter import MarkdownRewriter
+from ..hugo.frontmatter import FrontMatterBuilder, add_frontmatter, split_first_heading, _today
 from ..hugo.menu_builder import MenuBuilder
-from ..hugo.shortcodes import generate_shortcodes
-from ..hugo.templates import generate_templates
+from ..hugo.assets import generate_hugo_assets
+from ..utils.fileio import write_if_changed
+from ..utils.slug import slugify
+
+# Broken link markers left by the link rewriter
+_BROKEN_LINK_WARNING = re.compile(r'\s*"⚠️ Broken link"')
+_WARNING_MARKER = re.compile(r'\s*⚠️[^"]*')
+
+# Threads writing content files
+_WRITE_WORKERS = 8
+
+# Extensions tried, in order, when resolving TOC file references
+_SOURCE_EXTENSIONS = ('', '.md', '.ipynb')
 
 
 class HugoBuilder:
     """Build a Hugo site from a Jupyter Book project."""
 
-    def __init__(self, source_dir: Path, output_dir: Path, verbose: bool = False):
+    def __init__(
+        self,
+        source_dir: Path,
+        output_dir: Path,
+        verbose: bool = False,
+        jobs: Optional[int] = None,
+        incremental: bool = False
+    ):
         """
         Initialize the Hugo builder.
 
@@ -27,10 +51,16 @@ class HugoBuilder:
             source_dir: Jupyter Book source directory
             output_dir: Output directory for Hugo site
             verbose: Enable verbose logging
+            jobs: Number of worker processes for converting files (defaults
+                to the CPU count; 1 converts everything in this process)
+            incremental: Skip pages whose source file, referenced images,
+                TOC and config are unchanged since the previous build
         """
         self.source_dir = source_dir
         self.output_dir = output_dir
         self.verbose = verbose
+        self.jobs = jobs
+        self.incremental = incremental
 
         # Paths
         self.toc_path = source_dir / "_toc.yml"
@@ -40,6 +70,8 @@ class HugoBuilder:
         self.content_dir = self.output_dir / "content"
         self.static_dir = self.output_dir / "static"
         self.layouts_dir = self.output_dir / "layouts"
+        self.cache_dir = self.output_dir / ".jupyter2hugo_cache"
+        self.manifest_path = self.cache_dir / "manifest.json"
 
         # Loaded data
         self.toc = None
@@ -47,44 +79,59 @@ class HugoBuilder:
         self.file_mapping = None
         self.link_rewriter = None
         self.image_processor = None
+        self.markdown_rewriter = None
+        self._converted = {}  # Map source file -> converted (markdown, metadata)
+        self._previous_pages = {}  # Manifest entries of the previous build
+        self._pages = {}  # Manifest entries of this build
+        self._directory_listings = {}  # Map source directory -> entries by name
+        self._write_pool = None  # Thread pool writing content files
+        self._write_futures = []
+        self._hugo_mod_init = None  # Background `hugo mod init` process
 
     def build(self):
         """Execute the full build process."""
         self.log("Starting Jupyter Book to Hugo conversion...")
 
-        # Step 1: Parse configuration
-        self.log("Step 1: Parsing configuration files...")
-        self._parse_config()
-
-        # Step 2: Initialize Hugo structure
-        self.log("Step 2: Initializing Hugo directory structure...")
-        self._init_hugo_structure()
-
-        # Step 3: Generate Hugo config
-        self.log("Step 3: Generating Hugo configuration...")
-        self._generate_hugo_config()
+        # Pages default to the build's date; refresh it for every build in
+        # long-running processes
+        _today.cache_clear()
 
-        # Step 4: Generate shortcodes and KaTeX support
-        self.log("Step 4: Generating Hugo shortcodes and KaTeX support...")
-        generate_shortcodes(self.layouts_dir)
-        generate_templates(self.layouts_dir)
-
-        # Step 5: Build file mapping for link rewriting
-        self.log("Step 5: Building file mapping...")
-        self._build_file_mapping()
-
-        # Step 6: Convert content files
-        self.log("Step 6: Converting content files...")
-        self._convert_content()
-
-        # Step 7: Copy images
-        self.log("Step 7: Processing images...")
-        self._copy_images()
-
-        # Step 8: Copy logo if present
-        if self.config and self.config.logo:
-            self.log("Step 8: Copying logo...")
-            self._copy_logo()
+        try:
+            # Step 1: Parse configuration
+            self.log("Step 1: Parsing configuration files...")
+            self._parse_config()
+
+            # Step 2: Initialize Hugo structure
+            self.log("Step 2: Initializing Hugo directory structure...")
+            self._init_hugo_structure()
+
+            # Step 3: Generate Hugo config
+            self.log("Step 3: Generating Hugo configuration...")
+            self._generate_hugo_config()
+
+            # Step 4: Generate shortcodes and KaTeX support
+            self.log("Step 4: Generating Hugo shortcodes and KaTeX support...")
+            generate_hugo_assets(self.layouts_dir)
+
+            # Step 5: Build file mapping for link rewriting
+            self.log("Step 5: Building file mapping...")
+            self._build_file_mapping()
+
+            # Step 6: Convert content files
+            self.log("Step 6: Converting content files...")
+            self._convert_content()
+
+            # Step 7: Copy images
+            self.log("Step 7: Processing images...")
+            self._copy_images()
+
+            # Step 8: Copy logo if present
+            if self.config and self.config.logo:
+                self.log("Step 8: Copying logo...")
+                self._copy_logo()
+        finally:
+            # Never leave the `hugo mod init` child behind, even on errors
+            self._finish_hugo_modules()
 
         self.log(f"\nConversion complete! Hugo site created at: {self.output_dir}")
         self.log("\nTo build and serve the site:")
@@ -96,41 +143,58 @@ class HugoBuilder:
         if not self.toc_path.exists():
             raise FileNotFoundError(f"TOC file not found: {self.toc_path}")
 
-        self.toc = load_toc(self.toc_path)
+        self.toc = load_toc(self.toc_path, self.cache_dir / "yaml")
         self.log(f"  Loaded TOC with {len(self.toc.parts)} parts")
 
         if self.config_path.exists():
-            self.config = load_config(self.config_path)
+            self.config = load_config(self.config_path, self.cache_dir / "yaml")
             self.log(f"  Loaded config: {self.config.title}")
         else:
             self.log("  No _config.yml found, using defaults")
 
     def _init_hugo_structure(self):
         """Create Hugo directory structure and initialize modules."""
-        # Create main directories
-        self.content_dir.mkdir(parents=True, exist_ok=True)
-        self.static_dir.mkdir(parents=True, exist_ok=True)
-        self.layouts_dir.mkdir(parents=True, exist_ok=True)
+        # Create the leaf directories; their parents are created with them
+        for directory in (
+            self.content_dir,
+            self.static_dir / "images",
+            self.static_dir / "css",
+            self.layouts_dir / "shortcodes",
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # A previous build already initialized the modules, and `hugo mod
+        # init` fails when go.mod exists
+        if not (self.output_dir / "go.mod").exists():
+            self._start_hugo_modules()
 
-        # Create subdirectories
-        (self.static_dir / "images").mkdir(parents=True, exist_ok=True)
-        (self.static_dir / "css").mkdir(parents=True, exist_ok=True)
-        (self.layouts_dir / "shortcodes").mkdir(parents=True, exist_ok=True)
+        self.log("  Created Hugo directory structure")
 
-        # Initialize Hugo modules
+    def _start_hugo_modules(self):
+        """Start `hugo mod init` in the background."""
+        # It overlaps with preparing the config, and is waited for before
+        # config.toml is written, so it never sees this build's config
         import subprocess
         try:
-            subprocess.run(
+            self._hugo_mod_init = subprocess.Popen(
                 ["hugo", "mod", "init", "example.com/site"],
                 cwd=self.output_dir,
-                capture_output=True,
-                check=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
-            self.log("  Initialized Hugo modules")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.log("  Warning: Could not initialize Hugo modules (hugo command not found)")
+        except FileNotFoundError:
+            self.warn("  Warning: Could not initialize Hugo modules (hugo command not found)")
 
-        self.log("  Created Hugo directory structure")
+    def _finish_hugo_modules(self):
+        """Wait for the background `hugo mod init`, if it is running."""
+        if self._hugo_mod_init is None:
+            return
+
+        if self._hugo_mod_init.wait() == 0:
+            self.log("  Initialized Hugo modules")
+        else:
+            self.warn("  Warning: Could not initialize Hugo modules")
+        self._hugo_mod_init = None
 
     def _generate_hugo_config(self):
         """Generate Hugo config.toml."""
@@ -179,26 +243,62 @@ title = "{title}"
         menu_config = MenuBuilder.build_menu_config(self.toc)
         config_content += "\n" + menu_config
 
-        # Write config file
-        (self.output_dir / "config.toml").write_text(config_content, encoding='utf-8')
+        # Write config file once `hugo mod init` is done
+        self._finish_hugo_modules()
+        write_if_changed(self.output_dir / "config.toml", config_content)
         self.log("  Generated config.toml")
 
     def _build_file_mapping(self):
         """Build mapping from source files to Hugo URLs."""
-        self.file_mapping = build_file_mapping(self.toc, self.source_dir, self.content_dir)
+        mapping = build_file_mapping(self.toc, self.source_dir, self.content_dir)
+
+        # Every link on every page is looked up in this table, so intern the
+        # keys to keep them as shared string objects with cached hashes
+        self.file_mapping = {sys.intern(key): value for key, value in mapping.items()}
+
+        # One rewriter and one image processor serve the whole build so their
+        # caches (resolved links, copied images) carry over between pages
         self.link_rewriter = LinkRewriter(self.file_mapping, self.source_dir, self.content_dir)
         self.image_processor = ImageProcessor(self.source_dir, self.static_dir)
+        self.markdown_rewriter = MarkdownRewriter(self.image_processor, self.link_rewriter)
         self.log(f"  Mapped {len(self.file_mapping)} files")
 
     def _convert_content(self):
         """Convert all content files."""
-        # Convert root file
-        if self.toc.root and self.toc.root.file:
-            self._convert_root_file()
+        if self.incremental:
+            self._load_manifest()
 
-        # Convert each part's chapters and sections
-        for part in self.toc.parts:
-            self._convert_part(part)
+        # Notebook and markdown conversion is CPU-bound and independent per
+        # file, so it runs up front across processes. Images, links and
+        # writes then happen here in TOC order, sharing the build's caches.
+        source_files = [
+            source_file for source_file, output_file in self._collect_pages()
+            if not self._is_unchanged(source_file, output_file)
+        ]
+        self._converted = self._convert_files(list(dict.fromkeys(source_files)))
+
+        # Writing pages is blocking I/O, so it is handed to threads and
+        # overlaps with processing the following pages
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as write_pool:
+            self._write_pool = write_pool
+
+            # Convert root file
+            if self.toc.root and self.toc.root.file:
+                self._convert_root_file()
+
+            # Convert each part's chapters and sections
+            for part in self.toc.parts:
+                self._convert_part(part)
+
+            # Raise any write error here
+            for future in self._write_futures:
+                future.result()
+
+        self._write_pool = None
+        self._write_futures = []
+
+        if self.incremental:
+            self._save_manifest()
 
     def _convert_root_file(self):
         """Convert the root index file."""
@@ -206,17 +306,26 @@ title = "{title}"
         source_file = self._resolve_source_file(root_entry.file)
 
         if not source_file:
-            self.log(f"  Warning: Root file not found: {root_entry.file}")
+            self.warn(f"  Warning: Root file not found: {root_entry.file}")
             return
 
-        self.log(f"  Converting root: {source_file.name}")
+        output_file = self.content_dir / "_index.md"
+        if self._is_unchanged(source_file, output_file):
+            if self.verbose:
+                self.log(f"  Unchanged root: {source_file.name}")
+            return
+
+        if self.verbose:
+            self.log(f"  Converting root: {source_file.name}")
 
         # Convert file
         markdown, metadata = self._convert_file(source_file)
 
         # Extract title
-        title = extract_title_from_markdown(markdown) or self.config.title if self.config else "Home"
-        markdown = remove_first_heading(markdown)
+        found_title, markdown = split_first_heading(markdown)
+        title = found_title or (self.config.title if self.config else None) or "Home"
+        # The root page is always left-trimmed, heading or not
+        markdown = markdown.lstrip()
 
         # Generate front matter
         fm = FrontMatterBuilder.from_metadata(
@@ -226,20 +335,19 @@ title = "{title}"
         )
 
         # Process images and links
-        markdown, _ = self.image_processor.process_images(markdown, source_file)
-        markdown, broken_links = self.link_rewriter.rewrite_links(markdown, source_file)
+        markdown, copied_images, broken_links = self.markdown_rewriter.rewrite(markdown, source_file)
 
         if broken_links:
             self.log(f"    Warning: {len(broken_links)} broken links")
 
         # Write to Hugo content
-        output_file = self.content_dir / "_index.md"
-        output_file.write_text(add_frontmatter(markdown, fm), encoding='utf-8')
+        self._write_page(output_file, add_frontmatter(markdown, fm))
+        self._record_page(source_file, output_file, copied_images)
 
     def _convert_part(self, part):
         """Convert all chapters and sections in a part."""
         # Create section directory
-        section_slug = self._slugify(part.caption)
+        section_slug = slugify(part.caption)
         section_dir = self.content_dir / section_slug
         section_dir.mkdir(parents=True, exist_ok=True)
 
@@ -254,25 +362,38 @@ title = "{title}"
         """Create _index.md for a section."""
         fm = FrontMatterBuilder.for_section_index(part.caption, part.weight)
         content = f"This section contains course materials for {part.caption}.\n"
-        (section_dir / "_index.md").write_text(add_frontmatter(content, fm), encoding='utf-8')
+        self._write_page(section_dir / "_index.md", add_frontmatter(content, fm))
 
     def _convert_chapter(self, chapter, part, section_dir: Path):
-        """Convert a chapter file."""
+        """Convert a chapter file and its sections."""
         source_file = self._resolve_source_file(chapter.file)
 
         if not source_file:
-            self.log(f"  Warning: File not found: {chapter.file}")
+            self.warn(f"  Warning: File not found: {chapter.file}")
             return
 
-        self.log(f"  Converting: {source_file.name}")
+        output_file = section_dir / f"{chapter.slug}.md"
+        if self._is_unchanged(source_file, output_file):
+            if self.verbose:
+                self.log(f"  Unchanged: {source_file.name}")
+        else:
+            self._convert_chapter_page(chapter, source_file, output_file)
+
+        # Convert sections
+        for section in chapter.sections:
+            self._convert_section(section, part, section_dir)
+
+    def _convert_chapter_page(self, chapter, source_file: Path, output_file: Path):
+        """Convert a chapter's own page."""
+        if self.verbose:
+            self.log(f"  Converting: {source_file.name}")
 
         # Convert file
         markdown, metadata = self._convert_file(source_file)
 
         # Extract title
-        title = chapter.title or extract_title_from_markdown(markdown) or chapter.slug.replace('-', ' ').title()
-        if extract_title_from_markdown(markdown):
-            markdown = remove_first_heading(markdown)
+        found_title, markdown = split_first_heading(markdown)
+        title = chapter.title or found_title or chapter.slug.replace('-', ' ').title()
 
         # Generate front matter (no menu parent for individual pages)
         fm = FrontMatterBuilder.from_metadata(
@@ -283,8 +404,7 @@ title = "{title}"
         )
 
         # Process images and links
-        markdown, _ = self.image_processor.process_images(markdown, source_file)
-        markdown, broken_links = self.link_rewriter.rewrite_links(markdown, source_file)
+        markdown, copied_images, broken_links = self.markdown_rewriter.rewrite(markdown, source_file)
 
         # Clean up broken link warnings from shortcodes
         markdown = self._clean_shortcode_warnings(markdown)
@@ -293,30 +413,32 @@ title = "{title}"
             self.log(f"    Warning: {len(broken_links)} broken links")
 
         # Write to Hugo content
-        output_file = section_dir / f"{chapter.slug}.md"
-        output_file.write_text(add_frontmatter(markdown, fm), encoding='utf-8')
-
-        # Convert sections
-        for section in chapter.sections:
-            self._convert_section(section, part, section_dir)
+        self._write_page(output_file, add_frontmatter(markdown, fm))
+        self._record_page(source_file, output_file, copied_images)
 
     def _convert_section(self, section, part, section_dir: Path):
         """Convert a section file."""
         source_file = self._resolve_source_file(section.file)
 
         if not source_file:
-            self.log(f"  Warning: File not found: {section.file}")
+            self.warn(f"  Warning: File not found: {section.file}")
+            return
+
+        output_file = section_dir / f"{section.slug}.md"
+        if self._is_unchanged(source_file, output_file):
+            if self.verbose:
+                self.log(f"    Unchanged section: {source_file.name}")
             return
 
-        self.log(f"    Converting section: {source_file.name}")
+        if self.verbose:
+            self.log(f"    Converting section: {source_file.name}")
 
         # Convert file
         markdown, metadata = self._convert_file(source_file)
 
         # Extract title
-        title = section.title or extract_title_from_markdown(markdown) or section.slug.replace('-', ' ').title()
-        if extract_title_from_markdown(markdown):
-            markdown = remove_first_heading(markdown)
+        found_title, markdown = split_first_heading(markdown)
+        title = section.title or found_title or section.slug.replace('-', ' ').title()
 
         # Generate front matter (no menu parent for individual pages)
         fm = FrontMatterBuilder.from_metadata(
@@ -327,8 +449,7 @@ title = "{title}"
         )
 
         # Process images and links
-        markdown, _ = self.image_processor.process_images(markdown, source_file)
-        markdown, broken_links = self.link_rewriter.rewrite_links(markdown, source_file)
+        markdown, copied_images, broken_links = self.markdown_rewriter.rewrite(markdown, source_file)
 
         # Clean up broken link warnings from shortcodes
         markdown = self._clean_shortcode_warnings(markdown)
@@ -337,31 +458,177 @@ title = "{title}"
             self.log(f"      Warning: {len(broken_links)} broken links")
 
         # Write to Hugo content
-        output_file = section_dir / f"{section.slug}.md"
-        output_file.write_text(add_frontmatter(markdown, fm), encoding='utf-8')
+        self._write_page(output_file, add_frontmatter(markdown, fm))
+        self._record_page(source_file, output_file, copied_images)
+
+    def _write_page(self, output_file: Path, content: str):
+        """Write a content file, on the write pool while converting content."""
+        if self._write_pool is None:
+            write_if_changed(output_file, content)
+            return
+        self._write_futures.append(
+            self._write_pool.submit(write_if_changed, output_file, content)
+        )
+
+    def _collect_pages(self) -> List[Tuple[Path, Path]]:
+        """Resolve the source and output files of all pages, in TOC order."""
+        pages = []
+
+        if self.toc.root and self.toc.root.file:
+            root_file = self._resolve_source_file(self.toc.root.file)
+            if root_file:
+                pages.append((root_file, self.content_dir / "_index.md"))
+
+        for part in self.toc.parts:
+            section_dir = self.content_dir / slugify(part.caption)
+            for chapter in part.chapters:
+                chapter_file = self._resolve_source_file(chapter.file)
+                if not chapter_file:
+                    # Sections of a missing chapter are skipped as well
+                    continue
+                pages.append((chapter_file, section_dir / f"{chapter.slug}.md"))
+
+                for section in chapter.sections:
+                    section_file = self._resolve_source_file(section.file)
+                    if section_file:
+                        pages.append((section_file, section_dir / f"{section.slug}.md"))
+
+        return pages
+
+    def _convert_files(self, source_files: List[Path]) -> Dict[Path, Tuple[str, Dict[str, Any]]]:
+        """
+        Convert source files in worker processes.
+
+        Args:
+            source_files: Notebook and markdown files to convert (each once)
+
+        Returns:
+            Dict mapping each source file to its (markdown, metadata), or an
+            empty dict when conversion is left to happen page by page
+        """
+        jobs = min(self.jobs or os.cpu_count() or 1, len(source_files))
+
+        # Not worth starting processes for a single worker
+        if jobs <= 1:
+            return {}
+
+        chunksize = max(1, len(source_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(_convert_source_file, source_files, chunksize=chunksize)
+            return dict(zip(source_files, results))
 
     def _convert_file(self, file_path: Path):
         """Convert a notebook or markdown file."""
-        if file_path.suffix == '.ipynb':
-            return convert_notebook(file_path)
-        elif file_path.suffix == '.md':
-            return convert_markdown(file_path)
-        else:
-            raise ValueError(f"Unsupported file type: {file_path.suffix}")
+        # Use the result converted up front, if any (once, as a file listed
+        # twice gets its own copy of the metadata the second time)
+        converted = self._converted.pop(file_path, None)
+        if converted is not None:
+            return converted
+        return _convert_source_file(file_path)
+
+    def _load_manifest(self):
+        """Load the page manifest of the previous build, if still valid."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+
+        # A different TOC, config or converter version can change any page
+        if manifest.get('dependencies') == self._dependency_signature():
+            self._previous_pages = manifest.get('pages', {})
+
+    def _save_manifest(self):
+        """Write the page manifest for the next incremental build."""
+        manifest = {
+            'dependencies': self._dependency_signature(),
+            'pages': self._pages,
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    def _dependency_signature(self) -> List[Any]:
+        """Get the signature of the inputs shared by every page."""
+        return [__version__, _file_signature(self.toc_path), _file_signature(self.config_path)]
+
+    def _is_unchanged(self, source_file: Path, output_file: Path) -> bool:
+        """
+        Check whether a page is up to date with the previous build.
+
+        Args:
+            source_file: Source notebook or markdown file
+            output_file: Hugo content file written for it
+
+        Returns:
+            True if incremental mode is on and the page can be skipped
+        """
+        if not self.incremental:
+            return False
+
+        key = output_file.relative_to(self.content_dir).as_posix()
+        entry = self._previous_pages.get(key)
+        if (
+            entry is None
+            or entry['source'] != source_file.relative_to(self.source_dir).as_posix()
+            or entry['signature'] != _file_signature(source_file)
+            or not output_file.exists()
+        ):
+            return False
+
+        for image, signature in entry['images'].items():
+            if _file_signature(Path(image)) != signature:
+                return False
+
+        # Carry the entry over to this build's manifest
+        self._pages[key] = entry
+        return True
+
+    def _record_page(self, source_file: Path, output_file: Path, copied_images: List[str]):
+        """Record a converted page in this build's manifest."""
+        if not self.incremental:
+            return
+
+        key = output_file.relative_to(self.content_dir).as_posix()
+        self._pages[key] = {
+            'source': source_file.relative_to(self.source_dir).as_posix(),
+            'signature': _file_signature(source_file),
+            'images': {image: _file_signature(Path(image)) for image in copied_images},
+        }
 
     def _resolve_source_file(self, file_ref: str) -> Optional[Path]:
         """Resolve a file reference to an actual file path."""
         if not file_ref:
             return None
 
-        # Try with different extensions
-        for ext in ['', '.md', '.ipynb']:
-            candidate = self.source_dir / f"{file_ref}{ext}"
+        # Try with different extensions, looking the names up in the
+        # directory's listing (read once per directory) instead of calling
+        # stat for each candidate
+        candidates = [self.source_dir / f"{file_ref}{ext}" for ext in _SOURCE_EXTENSIONS]
+        for candidate in candidates:
+            entry = self._list_directory(candidate.parent).get(candidate.name)
+            # Symlinks are followed, as exists() would
+            if entry is not None and (not entry.is_symlink() or candidate.exists()):
+                return candidate
+
+        # The filesystem may still match a name the listing does not have
+        # (e.g. a differently cased name on a case-insensitive filesystem)
+        for candidate in candidates:
             if candidate.exists():
                 return candidate
 
         return None
 
+    def _list_directory(self, directory: Path) -> Dict[str, os.DirEntry]:
+        """Get a directory's entries by name (cached; empty if unreadable)."""
+        listing = self._directory_listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = {entry.name: entry for entry in entries}
+            except OSError:
+                listing = {}
+            self._directory_listings[directory] = listing
+        return listing
+
     def _copy_images(self):
         """Copy images directory if it exists."""
         images_dir = self.source_dir / "images"
@@ -376,28 +643,51 @@ title = "{title}"
         logo_path = parser.resolve_logo_path(self.config)
 
         if logo_path and logo_path.exists():
+            # The image directory copy may already have linked the logo here
             dest = self.static_dir / "images" / logo_path.name
-            shutil.copy2(logo_path, dest)
+            self.image_processor.copy_file(logo_path, dest)
             self.log(f"  Copied logo: {logo_path.name}")
 
     def _clean_shortcode_warnings(self, markdown: str) -> str:
         """Remove broken link warnings from Hugo shortcode parameters."""
-        import re
+        # Both patterns need the marker; most pages have no broken links, so
+        # skip copying the whole page twice
+        if '⚠️' not in markdown:
+            return markdown
+
         # Remove "⚠️ Broken link" from shortcode parameters
-        markdown = re.sub(r'\s*"⚠️ Broken link"', '', markdown)
+        markdown = _BROKEN_LINK_WARNING.sub('', markdown)
         # Also remove from any other warning markers
-        markdown = re.sub(r'\s*⚠️[^"]*', '', markdown)
+        markdown = _WARNING_MARKER.sub('', markdown)
         return markdown
 
-    def _slugify(self, text: str) -> str:
-        """Convert text to URL-friendly slug."""
-        import re
-        slug = text.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[\s_]+', '-', slug)
-        return slug.strip('-')
-
     def log(self, message: str):
         """Log a message if verbose mode is enabled."""
-        if self.verbose or True:  # Always log for now
+        if self.verbose:
             print(message)
+
+    def warn(self, message: str):
+        """Log a warning, whether or not verbose mode is enabled."""
+        print(message)
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    """Get a file's modification time and size, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _convert_source_file(file_path: Path) -> Tuple[str, Dict[str, Any]]:
+    """Convert a notebook or markdown file (run in worker processes)."""
+    if file_path.suffix == '.ipynb':
+        # nbconvert takes a few hundred milliseconds to import, so only load
+        # it once a notebook actually needs converting
+        from ..converters.notebook_converter import convert_notebook
+        return convert_notebook(file_path)
+    elif file_path.suffix == '.md':
+        return convert_markdown(file_path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_path.suffix}")
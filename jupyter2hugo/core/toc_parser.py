@@ -2,11 +2,19 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-import yaml
+from typing import Iterator, List, Optional, Dict, Any
+import sys
 
+from .yaml_cache import load_yaml_cached
 
-@dataclass
+# Slotted instances skip the per-object __dict__; slots need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Source file extensions that TOC entries and links may include or omit
+_SOURCE_SUFFIXES = ('.md', '.ipynb')
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TocEntry:
     """Represents a single entry in the table of contents."""
 
@@ -43,7 +51,7 @@ class TocEntry:
         return ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TocPart:
     """Represents a part in the table of contents."""
 
@@ -52,7 +60,7 @@ class TocPart:
     weight: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TableOfContents:
     """Complete table of contents structure."""
 
@@ -60,42 +68,44 @@ class TableOfContents:
     root: TocEntry
     parts: List[TocPart] = field(default_factory=list)
 
-    def get_all_files(self) -> List[TocEntry]:
-        """Get a flat list of all file entries in order."""
-        files = [self.root] if self.root and self.root.file else []
+    def get_all_files(self) -> Iterator[TocEntry]:
+        """Iterate over all file entries in order."""
+        if self.root and self.root.file:
+            yield self.root
 
         for part in self.parts:
             for chapter in part.chapters:
-                files.append(chapter)
-                files.extend(chapter.sections)
-
-        return files
+                yield chapter
+                yield from chapter.sections
 
     def get_file_mapping(self) -> Dict[str, TocEntry]:
-        """Get a mapping from file path to TocEntry."""
-        mapping = {}
-        for entry in self.get_all_files():
-            if entry.file:
-                # Store without extension for flexible matching
-                base = str(Path(entry.file).with_suffix(''))
-                mapping[base] = entry
-                # Also store with common extensions
-                mapping[f"{base}.md"] = entry
-                mapping[f"{base}.ipynb"] = entry
-        return mapping
+        """
+        Get a mapping from file path to TocEntry.
+
+        Keys are made with source_key, one per entry; look paths up with
+        source_key as well.
+        """
+        return {
+            source_key(entry.file): entry
+            for entry in self.get_all_files()
+            if entry.file
+        }
 
 
 class TocParser:
     """Parser for Jupyter Book _toc.yml files."""
 
-    def __init__(self, toc_path: Path):
+    def __init__(self, toc_path: Path, cache_dir: Optional[Path] = None):
         """
         Initialize the TOC parser.
 
         Args:
             toc_path: Path to the _toc.yml file
+            cache_dir: Directory for caching the parsed YAML between builds
+                (see load_yaml_cached)
         """
         self.toc_path = toc_path
+        self.cache_dir = cache_dir
         self.toc_dir = toc_path.parent
 
     def parse(self) -> TableOfContents:
@@ -105,8 +115,8 @@ class TocParser:
         Returns:
             TableOfContents object with parsed structure
         """
-        with open(self.toc_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        # The TOC is only read here, so the cached data is used directly
+        data = load_yaml_cached(self.toc_path, self.cache_dir)
 
         toc_format = data.get('format', 'jb-book')
         root_file = data.get('root', '')
@@ -156,29 +166,20 @@ class TocParser:
         weight: int,
         level: int = 1
     ) -> TocEntry:
-        """Parse a chapter or section entry."""
-        file_path = chapter_data.get('file', '')
-        title = chapter_data.get('title')
-
-        chapter = TocEntry(
-            file=file_path,
-            title=title,
-            weight=weight,
-            parent=parent,
-            level=level
-        )
-
-        # Parse sections recursively
-        section_weight = 1
-        for section_data in chapter_data.get('sections', []):
-            section = self._parse_chapter(
-                section_data,
-                parent=title or file_path,
-                weight=section_weight,
-                level=level + 1
-            )
-            chapter.sections.append(section)
-            section_weight += 1
+        """Parse a chapter or section entry, including nested sections."""
+        chapter = _make_entry(chapter_data, parent, weight, level)
+
+        # Nested sections are parsed with an explicit stack instead of
+        # recursion. Each entry's sections are created (in order) when the
+        # entry is taken off the stack, then queued for their own sections.
+        stack = [(chapter, chapter_data)]
+        while stack:
+            entry, entry_data = stack.pop()
+            section_parent = entry.title or entry.file
+            for section_weight, section_data in enumerate(entry_data.get('sections', []), start=1):
+                section = _make_entry(section_data, section_parent, section_weight, entry.level + 1)
+                entry.sections.append(section)
+                stack.append((section, section_data))
 
         return chapter
 
@@ -204,15 +205,48 @@ class TocParser:
         return None
 
 
-def load_toc(toc_path: Path) -> TableOfContents:
+def _make_entry(entry_data: Dict[str, Any], parent: str, weight: int, level: int) -> TocEntry:
+    """Create a TOC entry (without its sections) from its YAML data."""
+    return TocEntry(
+        file=entry_data.get('file', ''),
+        title=entry_data.get('title'),
+        weight=weight,
+        parent=parent,
+        level=level
+    )
+
+
+def source_key(path: str) -> str:
+    """
+    Get the key a source file is mapped under: its path without a .md or
+    .ipynb extension.
+
+    Other extensions are kept, so dotted names such as chapters/v1.2 stay
+    whole.
+
+    Args:
+        path: Source file path, relative to the book root, with or without
+            its extension
+
+    Returns:
+        Mapping key
+    """
+    for ext in _SOURCE_SUFFIXES:
+        if path.endswith(ext):
+            return path[:-len(ext)]
+    return path
+
+
+def load_toc(toc_path: Path, cache_dir: Optional[Path] = None) -> TableOfContents:
     """
     Convenience function to load and parse a _toc.yml file.
 
     Args:
         toc_path: Path to _toc.yml
+        cache_dir: Directory for caching the parsed YAML between builds
 
     Returns:
         Parsed TableOfContents
     """
-    parser = TocParser(toc_path)
+    parser = TocParser(toc_path, cache_dir)
     return parser.parse()
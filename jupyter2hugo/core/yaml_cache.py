@@ -0,0 +1,111 @@
+"""Load YAML files through an in-memory and on-disk cache."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+import hashlib
+import json
+import os
+import tempfile
+import yaml
+
+# The libyaml-backed loader parses in C; fall back to the pure-Python one
+# when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+def load_yaml_cached(path: Path, cache_dir: Optional[Path] = None) -> Any:
+    """
+    Load a YAML file, reusing the parsed data while the file is unchanged.
+
+    Parsed data is kept in memory for the running process and, if a cache
+    directory is given, stored there as JSON for later builds, keyed on the
+    file's modification time and size. Data JSON cannot hold as-is (e.g.
+    YAML dates or non-string keys) is not stored and is parsed again by
+    later builds. The returned data is shared between callers,
+    so copy it before modifying it.
+
+    Args:
+        path: Path to the YAML file
+        cache_dir: Directory for the on-disk cache, inside the build's own
+            output (e.g. the site's .jupyter2hugo_cache); only the in-memory
+            cache is used if omitted
+
+    Returns:
+        Parsed YAML data (None for an empty file)
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    if cache_dir is not None:
+        cache_dir = str(cache_dir)
+    return _load_yaml(str(path), stat.st_mtime_ns, stat.st_size, cache_dir)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int, size: int, cache_dir: Optional[str]) -> Any:
+    """
+    Load a YAML file from the on-disk cache, or parse and cache it.
+
+    Args:
+        path: Resolved path to the YAML file
+        mtime_ns: Modification time of the file, in nanoseconds
+        size: Size of the file in bytes
+        cache_dir: Directory for the on-disk cache, or None for no disk cache
+
+    Returns:
+        Parsed YAML data
+    """
+    if cache_dir is None:
+        return _parse_yaml(path)
+
+    key = [path, mtime_ns, size]
+
+    # One cache file per YAML file, replaced whenever the file changes. The
+    # cache sits in the site output, which may come from elsewhere, so it
+    # is only ever read as plain JSON data.
+    cache_file = Path(cache_dir) / f"{hashlib.sha1(path.encode('utf-8')).hexdigest()}.json"
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry['key'] == key:
+            return entry['data']
+    except Exception:
+        # Missing, unreadable, or written by an incompatible version
+        pass
+
+    data = _parse_yaml(path)
+    _write_cache(cache_file, key, data)
+    return data
+
+
+def _parse_yaml(path: str) -> Any:
+    """Parse a YAML file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _write_cache(cache_file: Path, key: list, data: Any):
+    """Write a cache entry atomically, ignoring failures."""
+    try:
+        content = json.dumps({'key': key, 'data': data})
+        # Only cache data that reads back unchanged
+        if json.loads(content)['data'] != data:
+            return
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        # The cache is only an optimization (e.g. data JSON cannot encode, or
+        # a read-only output directory)
+        pass
@@ -0,0 +1,22 @@
+"""Generate all static Hugo assets (shortcodes, CSS, KaTeX partials) together."""
+
+from pathlib import Path
+
+from ..utils.fileio import write_planned_files
+from .shortcodes import shortcode_files
+from .templates import katex_partial_files
+
+
+def generate_hugo_assets(layouts_dir: Path):
+    """
+    Generate shortcodes, CSS and KaTeX partials in one pass.
+
+    Writes the files of generate_shortcodes and generate_templates as one
+    plan: each directory is created once and all files are written in one
+    batch.
+
+    Args:
+        layouts_dir: Hugo layouts directory
+    """
+    katex_files, katex_links = katex_partial_files(layouts_dir)
+    write_planned_files(shortcode_files(layouts_dir) + katex_files, katex_links)
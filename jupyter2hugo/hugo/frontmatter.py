@@ -1,12 +1,25 @@
 """Generate Hugo front matter for pages."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import json
+import re
+import sys
 import yaml
 
+# First level-one heading
+_HEADING_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
 
-@dataclass
+# First level-one heading line, including its line break
+_HEADING_LINE_PATTERN = re.compile(r'^#\s+(.+)$\n?', re.MULTILINE)
+
+# Slotted instances skip the per-object __dict__; slots need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FrontMatter:
     """Hugo front matter for a page."""
 
@@ -47,7 +60,7 @@ class FrontMatter:
             data['date'] = self.date
         else:
             # Use current date if not specified
-            data['date'] = datetime.now().strftime('%Y-%m-%d')
+            data['date'] = _today()
 
         if self.description:
             data['description'] = self.description
@@ -90,12 +103,80 @@ class FrontMatter:
         if self.params:
             data['params'] = self.params
 
-        # Convert to YAML with proper formatting
-        yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        # Convert to YAML with proper formatting. The fields above only hold
+        # a few simple types, which are emitted directly; anything else
+        # (e.g. custom params) goes through the generic dumper.
+        yaml_str = _emit_yaml(data)
+        if yaml_str is None:
+            yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
         return f"---\n{yaml_str}---\n\n"
 
 
+@lru_cache(maxsize=1)
+def _today() -> str:
+    """Get the current date, computed once per build (see HugoBuilder.build)."""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _emit_yaml(data: Dict[str, Any], indent: str = '') -> Optional[str]:
+    """
+    Emit front matter data as block-style YAML without the generic dumper.
+
+    Supports strings, integers, booleans, flat lists of those, and nested
+    dicts. Strings are always double-quoted (JSON string syntax is valid
+    YAML), so no value can be misread as another type.
+
+    Args:
+        data: Mapping to emit
+        indent: Indentation of the mapping's keys
+
+    Returns:
+        YAML text, or None if a value needs the generic dumper
+    """
+    lines = []
+    for key, value in data.items():
+        if not isinstance(key, str) or not key.isidentifier():
+            return None
+
+        if isinstance(value, dict):
+            if not value:
+                return None
+            nested = _emit_yaml(value, indent + '  ')
+            if nested is None:
+                return None
+            lines.append(f'{indent}{key}:\n{nested}')
+            continue
+
+        if isinstance(value, list):
+            items = [_emit_scalar(item) for item in value]
+            if None in items:
+                return None
+            scalar = f'[{", ".join(items)}]'
+        else:
+            scalar = _emit_scalar(value)
+            if scalar is None:
+                return None
+
+        lines.append(f'{indent}{key}: {scalar}\n')
+
+    return ''.join(lines)
+
+
+def _emit_scalar(value: Any) -> Optional[str]:
+    """Emit a string, integer, or boolean as a YAML scalar (None if unsupported)."""
+    if isinstance(value, str):
+        # Line breaks and control characters are left to the generic dumper
+        if not value.isprintable():
+            return None
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    return None
+
+
 class FrontMatterBuilder:
     """Build front matter from various sources."""
 
@@ -221,8 +302,7 @@ def extract_title_from_markdown(markdown: str) -> Optional[str]:
     Returns:
         Title string or None
     """
-    import re
-    match = re.search(r'^#\s+(.+)$', markdown, re.MULTILINE)
+    match = _HEADING_PATTERN.search(markdown)
     if match:
         return match.group(1).strip()
     return None
@@ -238,7 +318,27 @@ def remove_first_heading(markdown: str) -> str:
     Returns:
         Markdown without first heading
     """
-    import re
     # Remove first top-level heading
-    markdown = re.sub(r'^#\s+.+$\n?', '', markdown, count=1, flags=re.MULTILINE)
+    markdown = _HEADING_LINE_PATTERN.sub('', markdown, count=1)
     return markdown.lstrip()
+
+
+def split_first_heading(markdown: str) -> Tuple[Optional[str], str]:
+    """
+    Extract the first # heading and remove it from markdown in one scan.
+
+    Equivalent to extract_title_from_markdown followed, when a title was
+    found, by remove_first_heading.
+
+    Args:
+        markdown: Markdown content
+
+    Returns:
+        Tuple of (title or None, markdown without the heading)
+    """
+    match = _HEADING_LINE_PATTERN.search(markdown)
+    if match:
+        title = match.group(1).strip()
+        if title:
+            return title, (markdown[:match.start()] + markdown[match.end():]).lstrip()
+    return None, markdown
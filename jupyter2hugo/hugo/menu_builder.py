@@ -1,6 +1,18 @@
 """Build Hugo menu configuration from TOC structure."""
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Iterator, List, Dict, Any, Tuple
+
+from ..utils.slug import slugify
+
+# TOML for one main menu entry
+_MENU_TEMPLATE = (
+    '[[menu.main]]\n'
+    '  identifier = "{identifier}"\n'
+    '  name = "{name}"\n'
+    '  url = "{url}"\n'
+    '  weight = {weight}\n'
+)
 
 
 class MenuBuilder:
@@ -17,30 +29,9 @@ class MenuBuilder:
         Returns:
             TOML configuration string for Hugo menus
         """
-        menu_items = []
-
-        # Add menu items for each part (section)
-        for part in toc.parts:
-            section_slug = _slugify(part.caption)
-            menu_item = {
-                'identifier': section_slug,
-                'name': part.caption,
-                'url': f'/{section_slug}/',
-                'weight': part.weight
-            }
-            menu_items.append(menu_item)
-
-        # Generate TOML
-        toml_lines = []
-        for item in menu_items:
-            toml_lines.append("[[menu.main]]")
-            toml_lines.append(f'  identifier = "{item["identifier"]}"')
-            toml_lines.append(f'  name = "{item["name"]}"')
-            toml_lines.append(f'  url = "{item["url"]}"')
-            toml_lines.append(f'  weight = {item["weight"]}')
-            toml_lines.append("")
-
-        return "\n".join(toml_lines)
+        # The menu only depends on the parts' captions and weights, so it is
+        # rendered once per distinct set of them
+        return _render_menu_config(tuple((part.caption, part.weight) for part in toc.parts))
 
     @staticmethod
     def build_sidebar_data(toc) -> Dict[str, Any]:
@@ -61,7 +52,7 @@ class MenuBuilder:
             'sections': []
         }
 
-        for part in toc.parts:
+        for part, part_slug in _iter_parts_with_slugs(toc):
             section = {
                 'title': part.caption,
                 'weight': part.weight,
@@ -70,16 +61,16 @@ class MenuBuilder:
 
             for chapter in part.chapters:
                 page = {
-                    'title': chapter.title or chapter.slug.replace('-', ' ').title(),
-                    'url': f'/{_slugify(part.caption)}/{chapter.slug}/',
+                    'title': chapter.title or _title_from_slug(chapter.slug),
+                    'url': f'/{part_slug}/{chapter.slug}/',
                     'weight': chapter.weight,
                     'subsections': []
                 }
 
                 for sub in chapter.sections:
                     subsection = {
-                        'title': sub.title or sub.slug.replace('-', ' ').title(),
-                        'url': f'/{_slugify(part.caption)}/{sub.slug}/',
+                        'title': sub.title or _title_from_slug(sub.slug),
+                        'url': f'/{part_slug}/{sub.slug}/',
                         'weight': sub.weight
                     }
                     page['subsections'].append(subsection)
@@ -90,11 +81,85 @@ class MenuBuilder:
 
         return sidebar
 
+    @staticmethod
+    def build_sidebar_arrays(toc) -> Dict[str, Any]:
+        """
+        Build sidebar navigation data as flat parallel lists.
+
+        Holds the same data as build_sidebar_data, but as one list per field
+        instead of one dict per page, which is smaller and cheaper to
+        serialize for large books. Section i's pages are
+        page_*[section_page_offsets[i]:section_page_offsets[i + 1]], and
+        page j's subsections are sub_*[page_subsection_offsets[j]:
+        page_subsection_offsets[j + 1]].
+
+        Args:
+            toc: TableOfContents object
+
+        Returns:
+            Dict of parallel lists with the sidebar navigation structure
+        """
+        sidebar = {
+            'root': {
+                'title': toc.root.title or "Home",
+                'url': '/'
+            },
+            'section_titles': [],
+            'section_weights': [],
+            'section_page_offsets': [0],
+            'page_titles': [],
+            'page_urls': [],
+            'page_weights': [],
+            'page_subsection_offsets': [0],
+            'sub_titles': [],
+            'sub_urls': [],
+            'sub_weights': [],
+        }
+
+        for part, part_slug in _iter_parts_with_slugs(toc):
+            sidebar['section_titles'].append(part.caption)
+            sidebar['section_weights'].append(part.weight)
+
+            for chapter in part.chapters:
+                sidebar['page_titles'].append(chapter.title or _title_from_slug(chapter.slug))
+                sidebar['page_urls'].append(f'/{part_slug}/{chapter.slug}/')
+                sidebar['page_weights'].append(chapter.weight)
+
+                for sub in chapter.sections:
+                    sidebar['sub_titles'].append(sub.title or _title_from_slug(sub.slug))
+                    sidebar['sub_urls'].append(f'/{part_slug}/{sub.slug}/')
+                    sidebar['sub_weights'].append(sub.weight)
+
+                sidebar['page_subsection_offsets'].append(len(sidebar['sub_titles']))
+
+            sidebar['section_page_offsets'].append(len(sidebar['page_titles']))
+
+        return sidebar
+
 
-def _slugify(text: str) -> str:
-    """Convert text to URL-friendly slug."""
-    import re
-    slug = text.lower()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    return slug.strip('-')
+@lru_cache(maxsize=8)
+def _render_menu_config(parts: Tuple[Tuple[str, int], ...]) -> str:
+    """Render the menu TOML for (caption, weight) pairs of parts (cached)."""
+    # One menu entry per part (section), separated by blank lines
+    entries = []
+    for caption, weight in parts:
+        section_slug = slugify(caption)
+        entries.append(_MENU_TEMPLATE.format(
+            identifier=section_slug,
+            name=caption,
+            url=f'/{section_slug}/',
+            weight=weight
+        ))
+    return "\n".join(entries)
+
+
+def _iter_parts_with_slugs(toc) -> Iterator[Tuple[Any, str]]:
+    """Iterate over the TOC's parts with their section slugs."""
+    for part in toc.parts:
+        yield part, slugify(part.caption)
+
+
+@lru_cache(maxsize=2048)
+def _title_from_slug(slug: str) -> str:
+    """Derive a fallback page title from a slug (cached)."""
+    return slug.replace('-', ' ').title()
@@ -1,15 +1,12 @@
 """Generate Hugo shortcode templates."""
 
 from pathlib import Path
+from typing import List, Tuple, Union
 
+from ..utils.fileio import encode_text, write_planned_files
 
-class ShortcodeGenerator:
-    """Generate Hugo shortcode HTML templates."""
-
-    @staticmethod
-    def generate_admonition() -> str:
-        """Generate admonition shortcode template."""
-        return '''{{/* Admonition shortcode for notes, warnings, tips, etc. */}}
+# Admonition shortcode template
+_ADMONITION_TEMPLATE = '''{{/* Admonition shortcode for notes, warnings, tips, etc. */}}
 {{- $type := .Get "type" | default "note" -}}
 {{- $title := .Get "title" -}}
 {{- $class := .Get "class" | default "" -}}
@@ -26,10 +23,8 @@ class ShortcodeGenerator:
 </div>
 '''
 
-    @staticmethod
-    def generate_youtube() -> str:
-        """Generate YouTube embed shortcode template."""
-        return '''{{/* YouTube embed shortcode with accessibility */}}
+# YouTube embed shortcode template
+_YOUTUBE_TEMPLATE = '''{{/* YouTube embed shortcode with accessibility */}}
 {{- $id := .Get 0 -}}
 {{- $title := .Get "title" | default "YouTube video player" -}}
 
@@ -46,10 +41,8 @@ class ShortcodeGenerator:
 </div>
 '''
 
-    @staticmethod
-    def generate_figure() -> str:
-        """Generate figure shortcode template."""
-        return '''{{/* Figure shortcode with caption and alt text */}}
+# Figure shortcode template
+_FIGURE_TEMPLATE = '''{{/* Figure shortcode with caption and alt text */}}
 {{- $src := .Get "src" -}}
 {{- $alt := .Get "alt" | default "" -}}
 {{- $caption := .Get "caption" | default "" -}}
@@ -64,38 +57,8 @@ class ShortcodeGenerator:
 </figure>
 '''
 
-    @staticmethod
-    def generate_all(output_dir: Path):
-        """
-        Generate all shortcode templates.
-
-        Args:
-            output_dir: Directory to write shortcodes (layouts/shortcodes/)
-        """
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate admonition shortcode
-        (output_dir / "admonition.html").write_text(
-            ShortcodeGenerator.generate_admonition(),
-            encoding='utf-8'
-        )
-
-        # Generate YouTube shortcode
-        (output_dir / "youtube.html").write_text(
-            ShortcodeGenerator.generate_youtube(),
-            encoding='utf-8'
-        )
-
-        # Generate figure shortcode
-        (output_dir / "figure.html").write_text(
-            ShortcodeGenerator.generate_figure(),
-            encoding='utf-8'
-        )
-
-    @staticmethod
-    def generate_accessibility_css() -> str:
-        """Generate accessibility CSS for admonitions and content."""
-        return '''/* Accessibility styles for jupyter2hugo */
+# Accessibility styles for the shortcodes
+_ACCESSIBILITY_CSS = '''/* Accessibility styles for jupyter2hugo */
 
 /* Admonition styles */
 .admonition {
@@ -211,6 +174,73 @@ pre {
 }
 '''
 
+# Pre-encoded, as the stylesheet is written on every build
+_ACCESSIBILITY_CSS_BYTES = encode_text(_ACCESSIBILITY_CSS)
+
+# Shortcode templates by file name, in layouts/shortcodes/
+_SHORTCODE_TEMPLATES = (
+    ("admonition.html", _ADMONITION_TEMPLATE),
+    ("youtube.html", _YOUTUBE_TEMPLATE),
+    ("figure.html", _FIGURE_TEMPLATE),
+)
+
+
+def generate_admonition() -> str:
+    """Generate admonition shortcode template."""
+    return _ADMONITION_TEMPLATE
+
+
+def generate_youtube() -> str:
+    """Generate YouTube embed shortcode template."""
+    return _YOUTUBE_TEMPLATE
+
+
+def generate_figure() -> str:
+    """Generate figure shortcode template."""
+    return _FIGURE_TEMPLATE
+
+
+def generate_accessibility_css() -> str:
+    """Generate accessibility CSS for admonitions and content."""
+    return _ACCESSIBILITY_CSS
+
+
+def generate_all_shortcodes(output_dir: Path):
+    """
+    Generate all shortcode templates.
+
+    Args:
+        output_dir: Directory to write shortcodes (layouts/shortcodes/)
+    """
+    # Generate admonition, YouTube and figure shortcodes
+    write_planned_files([(output_dir / name, template) for name, template in _SHORTCODE_TEMPLATES])
+
+
+class ShortcodeGenerator:
+    """Generate Hugo shortcode HTML templates (wraps the module functions)."""
+
+    generate_admonition = staticmethod(generate_admonition)
+    generate_youtube = staticmethod(generate_youtube)
+    generate_figure = staticmethod(generate_figure)
+    generate_accessibility_css = staticmethod(generate_accessibility_css)
+    generate_all = staticmethod(generate_all_shortcodes)
+
+
+def shortcode_files(layouts_dir: Path) -> List[Tuple[Path, Union[str, bytes]]]:
+    """
+    Get the shortcode templates and stylesheet to write, with their content.
+
+    Args:
+        layouts_dir: Hugo layouts directory
+
+    Returns:
+        List of (path, content) pairs
+    """
+    shortcodes_dir = layouts_dir / "shortcodes"
+    files = [(shortcodes_dir / name, template) for name, template in _SHORTCODE_TEMPLATES]
+    files.append((layouts_dir.parent / "static" / "css" / "accessibility.css", _ACCESSIBILITY_CSS_BYTES))
+    return files
+
 
 def generate_shortcodes(layouts_dir: Path):
     """
@@ -219,13 +249,4 @@ def generate_shortcodes(layouts_dir: Path):
     Args:
         layouts_dir: Hugo layouts directory
     """
-    shortcodes_dir = layouts_dir / "shortcodes"
-    ShortcodeGenerator.generate_all(shortcodes_dir)
-
-    # Also generate CSS
-    static_css_dir = layouts_dir.parent / "static" / "css"
-    static_css_dir.mkdir(parents=True, exist_ok=True)
-    (static_css_dir / "accessibility.css").write_text(
-        ShortcodeGenerator.generate_accessibility_css(),
-        encoding='utf-8'
-    )
+    write_planned_files(shortcode_files(layouts_dir))
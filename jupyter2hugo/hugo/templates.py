@@ -1,23 +1,12 @@
 """Generate KaTeX partials only - no page templates."""
 
 from pathlib import Path
+from typing import List, Tuple
 
+from ..utils.fileio import encode_text, write_planned_files
 
-def generate_templates(layouts_dir: Path):
-    """
-    Generate only KaTeX partial templates for math rendering.
-
-    Does NOT generate page templates (baseof, single, list, etc.) so that
-    Hugo themes work properly. The generated config.toml includes a default theme.
-
-    Args:
-        layouts_dir: Hugo layouts directory
-    """
-    partials_dir = layouts_dir / "partials"
-    partials_dir.mkdir(parents=True, exist_ok=True)
-
-    # KaTeX partial for math rendering
-    katex = '''{{ if .Site.Params.math }}
+# KaTeX partial for math rendering
+_KATEX_PARTIAL = '''{{ if .Site.Params.math }}
 <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.css" crossorigin="anonymous">
 <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js" crossorigin="anonymous"></script>
 <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js" crossorigin="anonymous"
@@ -25,18 +14,47 @@ def generate_templates(layouts_dir: Path):
 {{ end }}
 '''
 
-    # Write KaTeX partial
-    (partials_dir / "katex.html").write_text(katex, encoding='utf-8')
+# Pre-encoded once for the five places it is written to
+_KATEX_PARTIAL_BYTES = encode_text(_KATEX_PARTIAL)
+
+
+def katex_partial_files(layouts_dir: Path) -> Tuple[List[Tuple[Path, bytes]], List[Tuple[Path, Path]]]:
+    """
+    Get the KaTeX partial files to write.
+
+    Args:
+        layouts_dir: Hugo layouts directory
 
-    # Theme-specific injection points for KaTeX
-    # hugo-book theme
-    book_inject = partials_dir / "docs" / "inject"
-    book_inject.mkdir(parents=True, exist_ok=True)
-    (book_inject / "head.html").write_text(katex, encoding='utf-8')
+    Returns:
+        Tuple of (files as (path, content) pairs, theme injection points as
+        (source, path) pairs hard-linked to the partial), as taken by
+        write_planned_files
+    """
+    partials_dir = layouts_dir / "partials"
+    katex_file = partials_dir / "katex.html"
+    injection_files = [
+        # hugo-book theme
+        partials_dir / "docs" / "inject" / "head.html",
+        # PaperMod theme (uses extend_head.html with underscore)
+        partials_dir / "extend_head.html",
+        # Generic theme injection points
+        partials_dir / "extend-head.html",
+        partials_dir / "head-custom.html",
+    ]
+    return (
+        [(katex_file, _KATEX_PARTIAL_BYTES)],
+        [(katex_file, injection_file) for injection_file in injection_files],
+    )
 
-    # PaperMod theme (uses extend_head.html with underscore)
-    (partials_dir / "extend_head.html").write_text(katex, encoding='utf-8')
 
-    # Generic theme injection points
-    (partials_dir / "extend-head.html").write_text(katex, encoding='utf-8')
-    (partials_dir / "head-custom.html").write_text(katex, encoding='utf-8')
+def generate_templates(layouts_dir: Path):
+    """
+    Generate only KaTeX partial templates for math rendering.
+
+    Does NOT generate page templates (baseof, single, list, etc.) so that
+    Hugo themes work properly. The generated config.toml includes a default theme.
+
+    Args:
+        layouts_dir: Hugo layouts directory
+    """
+    write_planned_files(*katex_partial_files(layouts_dir))
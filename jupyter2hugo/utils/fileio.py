@@ -0,0 +1,154 @@
+"""File writing helpers for generated site files."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+import os
+
+# Threads writing batches of small files
+_WRITE_WORKERS = 4
+
+
+def encode_text(text: str) -> bytes:
+    """
+    Encode text exactly as Path.write_text(text, encoding='utf-8') writes it.
+
+    Args:
+        text: File content
+
+    Returns:
+        Encoded file content
+    """
+    # Text mode would translate newlines on write; do the same here
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
+
+
+def write_if_changed(path: Path, content: Union[str, bytes], atomic: bool = False) -> bool:
+    """
+    Write a file unless it already holds exactly that content.
+
+    Leaving unchanged files alone keeps their modification times, so
+    `hugo server` only re-renders pages that actually changed between builds.
+    Text is written as Path.write_text(text, encoding='utf-8') would; bytes
+    (e.g. static content pre-encoded with encode_text) are written as-is.
+
+    Args:
+        path: File to write
+        content: File content
+        atomic: Write to a temporary file and swap it into place, so readers
+            never see a partly written file
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content if isinstance(content, bytes) else encode_text(content)
+
+    if _has_content(path, data):
+        return False
+
+    if atomic:
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    else:
+        path.write_bytes(data)
+    return True
+
+
+def write_all_if_changed(files: List[Tuple[Path, Union[str, bytes]]]) -> int:
+    """
+    Write several files with write_if_changed, overlapping the writes.
+
+    Args:
+        files: (path, content) pairs
+
+    Returns:
+        Number of files written
+    """
+    paths = [path for path, _ in files]
+    contents = [content for _, content in files]
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+        return sum(executor.map(write_if_changed, paths, contents))
+
+
+def make_parent_dirs(paths: Iterable[Path]):
+    """
+    Create the parent directories of several files.
+
+    Only the deepest distinct directories are created; parents=True creates
+    their ancestors along the way.
+
+    Args:
+        paths: Files about to be written
+    """
+    directories = {path.parent for path in paths}
+    for directory in directories:
+        if not any(directory in other.parents for other in directories):
+            directory.mkdir(parents=True, exist_ok=True)
+
+
+def write_planned_files(
+    files: List[Tuple[Path, Union[str, bytes]]],
+    links: Iterable[Tuple[Path, Path]] = ()
+):
+    """
+    Write a planned set of generated files in one pass.
+
+    Parent directories are created once, the files are written in one batch
+    with write_all_if_changed, and then each link target is hard-linked to
+    its source with link_if_changed.
+
+    Args:
+        files: (path, content) pairs
+        links: (source, path) pairs; each source must be one of files
+    """
+    links = list(links)
+    make_parent_dirs([path for path, _ in files] + [path for _, path in links])
+    write_all_if_changed(files)
+
+    # Links need their source in place, so they are made after the batch
+    contents = dict(files)
+    for source, path in links:
+        content = contents[source]
+        if isinstance(content, str):
+            content = encode_text(content)
+        link_if_changed(source, path, content)
+
+
+def link_if_changed(source: Path, path: Path, content: bytes) -> bool:
+    """
+    Make path a hard link to source, which already holds content.
+
+    Used for files written to several places, so the data is only written
+    once. Falls back to writing a copy where hard links are not supported
+    (e.g. some network or Windows filesystems). Like write_if_changed, a
+    file that already holds the content is left alone.
+
+    Args:
+        source: File already holding content
+        path: File to create
+        content: Encoded file content
+
+    Returns:
+        True if the file was linked or written, False if it was up to date
+    """
+    if _has_content(path, content):
+        return False
+
+    try:
+        if path.exists():
+            path.unlink()
+        os.link(source, path)
+    except OSError:
+        return write_if_changed(path, content)
+    return True
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Check whether a file exists and holds exactly the given bytes."""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False  # Missing or unreadable
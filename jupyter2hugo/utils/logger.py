@@ -1,38 +1,86 @@
 """Logging utilities for jupyter2hugo."""
 
 import logging
+import logging.config
 from typing import Optional
 
+# Package logger; loggers named jupyter2hugo.* propagate to its handler
+_PACKAGE_LOGGER = 'jupyter2hugo'
 
-def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+_configured = False
+
+
+def configure_logging(level: int = logging.INFO, fast_timestamps: bool = False):
+    """
+    Configure console output for the package's loggers.
+
+    The handler and formatter are set up once; later calls only change the
+    level.
+
+    Args:
+        level: Logging level
+        fast_timestamps: Stamp records with raw epoch seconds instead of a
+            formatted date, skipping a strftime call per record (for
+            high-volume debug logging)
+    """
+    global _configured
+    if _configured:
+        logging.getLogger(_PACKAGE_LOGGER).setLevel(level)
+        return
+
+    logging.config.dictConfig({
+        'version': 1,
+        'disable_existing_loggers': False,
+        'formatters': {
+            'standard': {
+                'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                'datefmt': '%Y-%m-%d %H:%M:%S',
+            },
+            'fast': {
+                'format': '%(created).6f - %(name)s - %(levelname)s - %(message)s',
+            },
+        },
+        'handlers': {
+            'console': {
+                'class': 'logging.StreamHandler',
+                'formatter': 'fast' if fast_timestamps else 'standard',
+            },
+        },
+        'loggers': {
+            _PACKAGE_LOGGER: {
+                'handlers': ['console'],
+                'level': level,
+            },
+        },
+    })
+    _configured = True
+
+
+def setup_logger(
+    name: str,
+    level: int = logging.INFO,
+    fast_timestamps: bool = False
+) -> logging.Logger:
     """
     Set up a logger with consistent formatting.
 
+    Output goes through the shared package handler (see configure_logging),
+    so name should be 'jupyter2hugo' or a child such as __name__.
+
     Args:
         name: Logger name
         level: Logging level
+        fast_timestamps: Use epoch-second timestamps (see configure_logging);
+            only applies if logging is not configured yet
 
     Returns:
         Configured logger
     """
+    if not _configured:
+        configure_logging(fast_timestamps=fast_timestamps)
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
-
-    # Create console handler
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
-
-    # Add handler to logger
-    if not logger.handlers:
-        logger.addHandler(handler)
-
     return logger
 
 
@@ -47,5 +95,5 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         Logger instance
     """
     if name is None:
-        name = 'jupyter2hugo'
+        name = _PACKAGE_LOGGER
     return logging.getLogger(name)
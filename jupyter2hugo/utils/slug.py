@@ -0,0 +1,43 @@
+"""URL slugs for section names, shared by content paths, links and menus."""
+
+from functools import lru_cache
+import re
+
+# Slug normalization
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[\s_]+')
+
+# ASCII fast path for the patterns above, on bytes. One translate deletes
+# what _SLUG_STRIP removes and maps what _SLUG_DASH replaces to a NUL mark;
+# deletion runs first, so no NUL from the input survives. Runs of marks are
+# then joined into a single dash.
+_SLUG_MARK = b'\x00'
+_SLUG_TABLE = bytes(0 if chr(c).isspace() or c == ord('_') else c for c in range(256))
+_SLUG_DELETE = bytes(
+    c for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '-_')
+)
+
+
+@lru_cache(maxsize=1024)
+def slugify(text: str) -> str:
+    """
+    Convert text to a URL-friendly slug (cached, as part captions repeat).
+
+    Section directories, link targets and menu URLs are all built with this
+    function, so they always agree.
+
+    Args:
+        text: Text to convert, e.g. a part caption
+
+    Returns:
+        Lowercase slug with runs of whitespace and underscores as dashes
+    """
+    if text.isascii():
+        slug = text.lower().encode('ascii').translate(_SLUG_TABLE, _SLUG_DELETE)
+        return b'-'.join(filter(None, slug.split(_SLUG_MARK))).strip(b'-').decode('ascii')
+
+    slug = text.lower()
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_DASH.sub('-', slug)
+    return slug.strip('-')
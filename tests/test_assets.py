@@ -0,0 +1,47 @@
+"""Tests for generating the static Hugo assets."""
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from jupyter2hugo.hugo.assets import generate_hugo_assets
+from jupyter2hugo.hugo.shortcodes import generate_shortcodes
+from jupyter2hugo.hugo.templates import generate_templates
+
+
+def _read_tree(root: Path):
+    """Map each file under root, by relative path, to its content."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob('*') if path.is_file()
+    }
+
+
+class GenerateAssetsTest(unittest.TestCase):
+    """The one-pass generator and the separate generators."""
+
+    def test_same_files_as_separate_generators(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            planned = Path(tmp) / "planned"
+            separate = Path(tmp) / "separate"
+
+            generate_hugo_assets(planned / "layouts")
+            generate_shortcodes(separate / "layouts")
+            generate_templates(separate / "layouts")
+
+            planned_files = _read_tree(planned)
+            self.assertIn("layouts/partials/extend_head.html", planned_files)
+            self.assertIn("static/css/accessibility.css", planned_files)
+            self.assertEqual(planned_files, _read_tree(separate))
+
+    def test_rerun_keeps_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            layouts_dir = Path(tmp) / "layouts"
+            generate_hugo_assets(layouts_dir)
+            before = _read_tree(Path(tmp))
+            generate_hugo_assets(layouts_dir)
+            self.assertEqual(_read_tree(Path(tmp)), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
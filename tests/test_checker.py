@@ -0,0 +1,44 @@
+"""Tests for the pa11y accessibility checker."""
+
+from unittest import mock
+import json
+import subprocess
+import unittest
+
+from jupyter2hugo.accessibility.checker import AccessibilityChecker
+
+
+def _pa11y_ci_output(report) -> subprocess.CompletedProcess:
+    """Fake a finished pa11y-ci run printing report as JSON."""
+    return subprocess.CompletedProcess(args=[], returncode=2, stdout=json.dumps(report), stderr='')
+
+
+class CheckUrlsTest(unittest.TestCase):
+    """Batch checks with pa11y-ci."""
+
+    def check(self, urls, report):
+        with mock.patch('subprocess.run', return_value=_pa11y_ci_output(report)):
+            return AccessibilityChecker().check_urls(urls)
+
+    def test_url_missing_from_results_fails(self):
+        results = self.check(
+            ['file:///a.html', 'file:///b.html'],
+            {'total': 2, 'results': {'file:///a.html': []}}
+        )
+        self.assertTrue(results[0]['passed'])
+        self.assertFalse(results[1]['passed'])
+        self.assertIn('error', results[1])
+
+    def test_report_without_results_fails(self):
+        results = self.check(['file:///a.html'], {'total': 1})
+        self.assertFalse(results[0]['passed'])
+
+    def test_issues_are_reported(self):
+        issue = {'code': 'WCAG2AA.H37', 'type': 'error', 'message': 'Missing alt'}
+        results = self.check(['file:///a.html'], {'results': {'file:///a.html': [issue]}})
+        self.assertEqual(results[0]['issues'], [issue])
+        self.assertFalse(results[0]['passed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+"""Tests for the Hugo site builder."""
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from jupyter2hugo.core.hugo_builder import HugoBuilder
+
+
+class LogoTest(unittest.TestCase):
+    """Copying the logo configured in _config.yml."""
+
+    def test_logo_in_images_dir_not_referenced_by_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_dir = Path(tmp) / "book"
+            output_dir = Path(tmp) / "site"
+            (source_dir / "images").mkdir(parents=True)
+            (source_dir / "_toc.yml").write_text("format: jb-book\nroot: intro\n")
+            (source_dir / "_config.yml").write_text("title: Book\nlogo: images/logo.png\n")
+            (source_dir / "intro.md").write_text("# Intro\n\nNo images here.\n")
+            (source_dir / "images" / "logo.png").write_bytes(b"logo")
+
+            HugoBuilder(source_dir, output_dir, jobs=1).build()
+
+            logo = output_dir / "static" / "images" / "logo.png"
+            self.assertEqual(logo.read_bytes(), b"logo")
+            self.assertEqual((source_dir / "images" / "logo.png").read_bytes(), b"logo")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests for rewriting internal links to Hugo URLs."""
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from jupyter2hugo.converters.link_rewriter import LinkRewriter, build_file_mapping
+from jupyter2hugo.core.toc_parser import load_toc
+
+
+class HtmlLinkTest(unittest.TestCase):
+    """Links to the built .html pages of source files."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source_dir = Path(tmp.name)
+        (self.source_dir / "chapters").mkdir()
+        for name in ("intro.md", "chapters/ch1.md", "chapters/ch2.ipynb", "chapters/v1.2.md"):
+            (self.source_dir / name).touch()
+
+        file_mapping = {
+            "intro": "_index",
+            "chapters/ch1": "getting-started/ch1",
+            "chapters/ch2": "part-two/ch2",
+            "chapters/v1.2": "part-two/v1.2",
+        }
+        self.rewriter = LinkRewriter(file_mapping, self.source_dir, self.source_dir / "content")
+
+    def rewrite(self, markdown: str, current_file: str) -> str:
+        return self.rewriter.rewrite_links(markdown, self.source_dir / current_file)[0]
+
+    def test_html_link_by_path(self):
+        self.assertEqual(
+            self.rewrite("[ch1](chapters/ch1.html)", "intro.md"),
+            "[ch1](/getting-started/ch1/)"
+        )
+
+    def test_html_link_by_filename(self):
+        self.assertEqual(
+            self.rewrite("[ch2](ch2.html#top)", "chapters/ch1.md"),
+            "[ch2](/part-two/ch2/#top)"
+        )
+
+    def test_dotted_name(self):
+        self.assertEqual(self.rewrite("[v](v1.2.md)", "chapters/ch1.md"), "[v](/part-two/v1.2/)")
+        self.assertEqual(self.rewrite("[v](v1.2.html)", "chapters/ch1.md"), "[v](/part-two/v1.2/)")
+
+
+class FileMappingTest(unittest.TestCase):
+    """Keys of the link mapping and the TOC's file mapping."""
+
+    def test_keys_match_toc_file_mapping(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source_dir = Path(tmp)
+            (source_dir / "_toc.yml").write_text(
+                "format: jb-book\n"
+                "root: intro.md\n"
+                "parts:\n"
+                "  - caption: Part Two\n"
+                "    chapters:\n"
+                "      - file: chapters/v1.2\n"
+                "      - file: chapters/ch2.ipynb\n"
+            )
+            toc = load_toc(source_dir / "_toc.yml")
+
+        mapping = build_file_mapping(toc, source_dir, source_dir / "content")
+        self.assertEqual(list(mapping), list(toc.get_file_mapping()))
+        self.assertEqual(list(mapping), ["intro", "chapters/v1.2", "chapters/ch2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for rewriting images and links in one pass."""
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from jupyter2hugo.converters.image_processor import ImageProcessor
+from jupyter2hugo.converters.link_rewriter import LinkRewriter
+from jupyter2hugo.converters.markdown_rewriter import MarkdownRewriter
+
+
+class LinkedImageTest(unittest.TestCase):
+    """Images used as the text of a link."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source_dir = Path(tmp.name) / "book"
+        self.static_dir = Path(tmp.name) / "site" / "static"
+        (self.source_dir / "chap").mkdir(parents=True)
+        (self.source_dir / "images").mkdir()
+        (self.source_dir / "intro.md").touch()
+        (self.source_dir / "chap" / "page.md").touch()
+        (self.source_dir / "chap" / "img.png").write_bytes(b"img")
+        (self.source_dir / "images" / "fig.png").write_bytes(b"fig")
+
+        link_rewriter = LinkRewriter(
+            {"intro": "_index", "chap/page": "part/page"},
+            self.source_dir,
+            self.source_dir / "content"
+        )
+        image_processor = ImageProcessor(self.source_dir, self.static_dir)
+        self.rewriter = MarkdownRewriter(image_processor, link_rewriter)
+
+    def test_linked_image(self):
+        markdown, copied, broken = self.rewriter.rewrite(
+            "[![x](img.png)](page.md)", self.source_dir / "chap" / "page.md"
+        )
+        self.assertEqual(markdown, "[![x](/images/chap/img.png)](page.md)")
+        self.assertEqual(broken, [])
+        self.assertEqual((self.static_dir / "images" / "chap" / "img.png").read_bytes(), b"img")
+
+    def test_external_badge_link(self):
+        markdown, copied, broken = self.rewriter.rewrite(
+            "[![badge](images/fig.png)](https://example.com/ci)", self.source_dir / "intro.md"
+        )
+        self.assertEqual(markdown, "[![badge](/images/fig.png)](https://example.com/ci)")
+        self.assertEqual(broken, [])
+        self.assertEqual(len(copied), 1)
+
+    def test_plain_link_still_rewritten(self):
+        markdown, _, broken = self.rewriter.rewrite(
+            "See [the page](chap/page.md).", self.source_dir / "intro.md"
+        )
+        self.assertEqual(markdown, "See [the page](/part/page/).")
+        self.assertEqual(broken, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for the Hugo menu and sidebar builder."""
+
+import unittest
+
+from jupyter2hugo.core.toc_parser import TableOfContents, TocEntry, TocPart
+from jupyter2hugo.hugo.menu_builder import MenuBuilder
+
+
+def _nested_from_arrays(arrays):
+    """Rebuild the build_sidebar_data layout from build_sidebar_arrays."""
+    sections = []
+    page_offsets = arrays['section_page_offsets']
+    sub_offsets = arrays['page_subsection_offsets']
+
+    for i, title in enumerate(arrays['section_titles']):
+        pages = []
+        for j in range(page_offsets[i], page_offsets[i + 1]):
+            subsections = [
+                {
+                    'title': arrays['sub_titles'][k],
+                    'url': arrays['sub_urls'][k],
+                    'weight': arrays['sub_weights'][k],
+                }
+                for k in range(sub_offsets[j], sub_offsets[j + 1])
+            ]
+            pages.append({
+                'title': arrays['page_titles'][j],
+                'url': arrays['page_urls'][j],
+                'weight': arrays['page_weights'][j],
+                'subsections': subsections,
+            })
+        sections.append({'title': title, 'weight': arrays['section_weights'][i], 'pages': pages})
+
+    return {'root': arrays['root'], 'sections': sections}
+
+
+class SidebarArraysTest(unittest.TestCase):
+    """The flat parallel-list form of the sidebar data."""
+
+    def setUp(self):
+        self.toc = TableOfContents(
+            format='jb-book',
+            root=TocEntry(file='intro', title='Welcome'),
+            parts=[
+                TocPart(caption='Getting Started', weight=1, chapters=[
+                    TocEntry(file='chapters/one', title='Chapter One', weight=1, sections=[
+                        TocEntry(file='chapters/one-a', weight=1),
+                        TocEntry(file='chapters/one-b', title='B', weight=2),
+                    ]),
+                    # Page without subsections
+                    TocEntry(file='chapters/two', weight=2),
+                ]),
+                # Empty section
+                TocPart(caption='Empty Part', weight=2),
+                TocPart(caption='Part_Two & More', weight=3, chapters=[
+                    TocEntry(file='more/three', weight=1, sections=[
+                        TocEntry(file='more/three-a', weight=1),
+                    ]),
+                ]),
+            ],
+        )
+
+    def test_matches_nested_sidebar(self):
+        arrays = MenuBuilder.build_sidebar_arrays(self.toc)
+        self.assertEqual(_nested_from_arrays(arrays), MenuBuilder.build_sidebar_data(self.toc))
+
+    def test_offsets(self):
+        arrays = MenuBuilder.build_sidebar_arrays(self.toc)
+        self.assertEqual(arrays['section_page_offsets'], [0, 2, 2, 3])
+        self.assertEqual(arrays['page_subsection_offsets'], [0, 2, 2, 3])
+        self.assertEqual(
+            arrays['page_urls'],
+            ['/getting-started/one/', '/getting-started/two/', '/part-two-more/three/']
+        )
+        self.assertEqual(arrays['sub_titles'], ['One A', 'B', 'Three A'])
+
+    def test_empty_toc(self):
+        toc = TableOfContents(format='jb-book', root=TocEntry(file='intro'))
+        arrays = MenuBuilder.build_sidebar_arrays(toc)
+        self.assertEqual(arrays['section_page_offsets'], [0])
+        self.assertEqual(arrays['page_subsection_offsets'], [0])
+        self.assertEqual(_nested_from_arrays(arrays), MenuBuilder.build_sidebar_data(toc))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for section slugs."""
+
+import itertools
+import re
+import unittest
+
+from jupyter2hugo.utils.slug import slugify
+
+
+def _reference_slugify(text: str) -> str:
+    """The regex-only slug rules that slugify's ASCII fast path must match."""
+    slug = text.lower()
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[\s_]+', '-', slug)
+    return slug.strip('-')
+
+
+class SlugifyTest(unittest.TestCase):
+    """slugify, used for section directories, links and menus alike."""
+
+    def test_captions(self):
+        cases = {
+            'Getting Started!': 'getting-started',
+            'Part_Two & More': 'part-two-more',
+            'Part  Two - Advanced_stuff': 'part-two---advanced-stuff',
+            '  -Trim me-  ': 'trim-me',
+            'Äpfel und Öl': 'äpfel-und-öl',
+            'Résumé — Übersicht': 'résumé-übersicht',
+            '': '',
+        }
+        for caption, slug in cases.items():
+            with self.subTest(caption=caption):
+                self.assertEqual(slugify(caption), slug)
+
+    def test_matches_reference_rules(self):
+        alphabet = 'aZ09 _-!.\t\x00é—'
+        for length in range(1, 4):
+            for chars in itertools.product(alphabet, repeat=length):
+                text = ''.join(chars)
+                self.assertEqual(slugify(text), _reference_slugify(text), repr(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
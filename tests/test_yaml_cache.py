@@ -0,0 +1,61 @@
+"""Tests for the cached YAML loader."""
+
+from pathlib import Path
+import datetime
+import tempfile
+import unittest
+
+from jupyter2hugo.core import yaml_cache
+from jupyter2hugo.core.yaml_cache import load_yaml_cached
+
+
+class YamlCacheTest(unittest.TestCase):
+    """Loading YAML through the on-disk cache."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cache_dir = self.tmp / "cache"
+        yaml_cache._load_yaml.cache_clear()
+        self.addCleanup(yaml_cache._load_yaml.cache_clear)
+
+    def load_fresh(self, path: Path):
+        """Load as a new build would, bypassing the in-memory cache."""
+        yaml_cache._load_yaml.cache_clear()
+        return load_yaml_cached(path, self.cache_dir)
+
+    def test_reuses_json_cache(self):
+        path = self.tmp / "_toc.yml"
+        path.write_text("format: jb-book\nparts:\n  - caption: One\n")
+        self.assertEqual(self.load_fresh(path), {"format": "jb-book", "parts": [{"caption": "One"}]})
+
+        cache_files = list(self.cache_dir.iterdir())
+        self.assertEqual([cache_file.suffix for cache_file in cache_files], [".json"])
+        self.assertEqual(self.load_fresh(path), {"format": "jb-book", "parts": [{"caption": "One"}]})
+
+    def test_data_json_cannot_hold_is_reparsed(self):
+        path = self.tmp / "_config.yml"
+        path.write_text("date: 2024-01-02\n1: one\n")
+        expected = {"date": datetime.date(2024, 1, 2), 1: "one"}
+        self.assertEqual(self.load_fresh(path), expected)
+        self.assertFalse(self.cache_dir.exists())
+        self.assertEqual(self.load_fresh(path), expected)
+
+    def test_corrupt_cache_is_ignored(self):
+        path = self.tmp / "_toc.yml"
+        path.write_text("root: intro\n")
+        self.load_fresh(path)
+        for cache_file in self.cache_dir.iterdir():
+            cache_file.write_bytes(b"\x80\x04not json")
+        self.assertEqual(self.load_fresh(path), {"root": "intro"})
+
+    def test_no_cache_dir_writes_nothing(self):
+        path = self.tmp / "_toc.yml"
+        path.write_text("root: intro\n")
+        self.assertEqual(load_yaml_cached(path), {"root": "intro"})
+        self.assertEqual([p.name for p in self.tmp.iterdir()], ["_toc.yml"])
+
+
+if __name__ == '__main__':
+    unittest.main()